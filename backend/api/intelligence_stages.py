@@ -223,12 +223,7 @@ def enrich_posts():
         )
         
         # Deep enrichment with comments - PARALLEL execution
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-        
-        enriched_posts = []
-        warnings = []
         max_workers = 5  # Same as pre-score for consistency
-        
         logger.info(
             "Starting parallel enrichment",
             extra={
@@ -238,53 +233,12 @@ def enrich_posts():
                 "max_workers": max_workers,
             },
         )
-        
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_map = {
-                executor.submit(
-                    collector.enrich_post,
-                    post,
-                    segment_name=segment_name,
-                    segment_config=config,
-                ): (index, post)
-                for index, post in enumerate(promising_posts)
-            }
-            
-            for future in as_completed(future_map):
-                index, original_post = future_map[future]
-                post_id = original_post.get("id") or ""
-                
-                try:
-                    enriched_post, post_warnings = future.result()
-                    enriched_post["_enrich_index"] = index
-                    enriched_posts.append(enriched_post)
-                    warnings.extend(post_warnings)
-                    
-                    logger.info(
-                        "Post enriched",
-                        extra={
-                            "operation": "enrich_stage",
-                            "segment_name": segment_name,
-                            "post_id": post_id,
-                            "progress": f"{len(enriched_posts)}/{len(promising_posts)}",
-                        },
-                    )
-                except Exception as exc:
-                    warning = f"Enrichment failed for post '{post_id}': {exc}"
-                    logger.exception(
-                        warning,
-                        extra={
-                            "operation": "enrich_stage",
-                            "segment_name": segment_name,
-                            "post_id": post_id,
-                        },
-                    )
-                    warnings.append(warning)
-        
-        # Sort by original order
-        enriched_posts.sort(key=lambda item: item.get("_enrich_index", 0))
-        for post in enriched_posts:
-            post.pop("_enrich_index", None)
+        enriched_posts, warnings = collector.enrich_posts(
+            promising_posts,
+            segment_name=segment_name,
+            segment_config=config,
+            max_workers=max_workers,
+        )
 
         # Final filter based on deep AI analysis
         final_threshold = config.get('ai_relevance_threshold', 6.0)
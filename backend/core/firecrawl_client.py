@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, Iterable, List, Optional
 import logging
 import time
@@ -77,7 +77,7 @@ class ScrapeResult:
             "title": self.title,
             "description": self.description,
             "error": self.error,
-            "scraped_at": datetime.utcnow().isoformat(),
+            "scraped_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
         }
 
 
@@ -101,7 +101,7 @@ class FirecrawlClient:
         return {
             "query": query,
             "results": results,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
         }
 
     def scrape_urls(self, urls: Iterable[str]) -> List[Dict[str, Any]]:
@@ -157,7 +157,7 @@ class FirecrawlClient:
         return {
             "success": True,
             "data": payload,
-            "extracted_at": datetime.utcnow().isoformat(),
+            "extracted_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
         }
 
 
@@ -6,16 +6,19 @@ import json
 import logging
 import os
 import re
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
 
-from google import genai
-from google.genai import types
 from pydantic import BaseModel, ValidationError
 
 from models.schemas import ArticleAnalysis, MultiArticleAnalysis
 
+if TYPE_CHECKING:
+    from google import genai
+
 
 class GeminiClientError(RuntimeError):
     """Raised when the Gemini API cannot return a usable response."""
@@ -23,6 +26,93 @@ class GeminiClientError(RuntimeError):
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson ships in requirements.txt
+    _json_loads = json.loads
+
+_JSON_PAYLOAD_RE = re.compile(r"(\{.*\}|\[.*\])", re.DOTALL)
+
+
+def _genai_types() -> Any:
+    """Import the google-genai ``types`` module on first use.
+
+    The SDK takes a noticeable share of cold-start time, so it is only loaded
+    once a request is actually built.
+    """
+    from google.genai import types
+
+    return types
+
+
+_SDK_CLIENT_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=8)
+def _shared_sdk_client(api_key: str) -> genai.Client:
+    """Return one SDK client per API key for the whole process.
+
+    ``genai.Client`` keeps an ``httpx`` connection pool, so sharing it lets
+    every ``GeminiClient`` (one is built per API request) and every worker
+    thread reuse warm TLS connections instead of handshaking per call.
+    """
+    from google import genai
+
+    return genai.Client(api_key=api_key)
+
+
+@lru_cache(maxsize=64)
+def _read_prompt_template(template_path: Path) -> str:
+    return template_path.read_text(encoding="utf-8")
+
+
+class _JsonCompletionTracker:
+    """Detect when a streamed JSON document has closed its top-level value.
+
+    Braces and brackets inside string literals are ignored so that titles or
+    quotes containing ``{``/``}`` do not end the stream early.
+    """
+
+    __slots__ = ("_depth", "_started", "_in_string", "_escaped", "consumed", "end")
+
+    def __init__(self) -> None:
+        self._depth = 0
+        self._started = False
+        self._in_string = False
+        self._escaped = False
+        self.consumed = 0
+        self.end: Optional[int] = None
+
+    def feed(self, text: str) -> bool:
+        """Consume ``text`` and return ``True`` once the document is complete."""
+
+        if self.end is not None:
+            return True
+        for offset, char in enumerate(text):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+            if char == '"' and self._started:
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+                self._started = True
+            elif char in "}]" and self._started:
+                self._depth -= 1
+                if self._depth == 0:
+                    self.end = self.consumed + offset + 1
+                    self.consumed += len(text)
+                    return True
+        self.consumed += len(text)
+        return False
+
 
 @dataclass(slots=True)
 class GeminiJsonResponse:
@@ -58,11 +148,18 @@ class GeminiClient:
     # Core helpers
     # ---------------------------------------------------------------------
     def _get_client(self) -> genai.Client:
+        """Return the pooled SDK client.
+
+        The client is safe to share between threads; thread pools should pass
+        the same ``GeminiClient`` to every worker rather than building one per
+        task, so requests reuse the same connection pool.
+        """
         if not self.api_key:
             raise GeminiClientError("GEMINI_API_KEY not configured.")
 
         if self._client is None:
-            self._client = genai.Client(api_key=self.api_key)
+            with _SDK_CLIENT_LOCK:
+                self._client = _shared_sdk_client(self.api_key)
         return self._client
 
     def _get_structured_model(self, model_name: str) -> Any:
@@ -76,9 +173,10 @@ class GeminiClient:
 
     def _load_prompt(self, template_name: str) -> str:
         template_path = self.prompt_dir / template_name
-        if not template_path.exists():
-            raise GeminiClientError(f"Prompt template not found: {template_path}")
-        return template_path.read_text(encoding="utf-8")
+        try:
+            return _read_prompt_template(template_path)
+        except FileNotFoundError as exc:
+            raise GeminiClientError(f"Prompt template not found: {template_path}") from exc
 
     @staticmethod
     def _clean_json_payload(raw_text: str) -> str:
@@ -93,37 +191,46 @@ class GeminiClient:
             return cleaned
 
         # Try to extract the first JSON object/array from the text.
-        match = re.search(r"(\{.*\}|\[.*\])", cleaned, re.DOTALL)
+        match = _JSON_PAYLOAD_RE.search(cleaned)
         if not match:
             raise GeminiClientError("Unable to locate JSON payload in Gemini response.")
         return match.group(1)
 
     @staticmethod
     def parse_json_response(raw_text: str) -> Any:
-        """Parse Gemini text into JSON with improved resilience."""
+        """Parse Gemini text into JSON with improved resilience.
+
+        Requests use ``response_mime_type="application/json"``, so the text is
+        normally strict JSON and a single ``orjson.loads`` suffices. The fence
+        stripping and payload extraction below only guard against models that
+        wrap or annotate their output.
+        """
+
+        try:
+            return _json_loads(raw_text)
+        except json.JSONDecodeError:
+            logger.debug("Gemini response is not strict JSON; attempting recovery")
 
         payload = GeminiClient._clean_json_payload(raw_text)
         try:
-            parsed = json.loads(payload)
+            parsed = _json_loads(payload)
         except json.JSONDecodeError as exc:  # noqa: BLE001 - expose parsing issues
             raise GeminiClientError(f"Gemini returned invalid JSON: {exc}") from exc
         return parsed
 
-    # ------------------------------------------------------------------
-    # Public API
-    # ------------------------------------------------------------------
-    def generate_json_response(
+    def _build_json_request(
         self,
         template_name: str,
         context: Dict[str, Any],
         *,
-        model: Optional[str] = None,
-        temperature: float = 0.3,
-        max_output_tokens: int = 2048,
-        system_prompt: Optional[str] = None,
-        response_schema: Optional[Dict[str, Any]] = None,
-    ) -> GeminiJsonResponse:
-        """Render a prompt template and request a JSON response from Gemini."""
+        temperature: float,
+        max_output_tokens: int,
+        system_prompt: Optional[str],
+        response_schema: Optional[Dict[str, Any]],
+    ) -> Tuple[Any, Any]:
+        """Render ``template_name`` and return ``(contents, config)`` for a JSON request."""
+
+        types = _genai_types()
 
         prompt_template = self._load_prompt(template_name)
         try:
@@ -163,17 +270,66 @@ class GeminiClient:
                         schema_config = response_schema
             config_kwargs["response_schema"] = schema_config
 
+        return contents, types.GenerateContentConfig(**config_kwargs)
+
+    def _json_response_from_chunks(
+        self, chunks: List[str], tracker: _JsonCompletionTracker
+    ) -> GeminiJsonResponse:
+        raw_text = "".join(chunks)
+        if tracker.end is not None:
+            raw_text = raw_text[: tracker.end]
+        parsed = self.parse_json_response(raw_text)
+        return GeminiJsonResponse(raw_text=raw_text, data=parsed)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def generate_json_response(
+        self,
+        template_name: str,
+        context: Dict[str, Any],
+        *,
+        model: Optional[str] = None,
+        temperature: float = 0.3,
+        max_output_tokens: int = 2048,
+        system_prompt: Optional[str] = None,
+        response_schema: Optional[Dict[str, Any]] = None,
+    ) -> GeminiJsonResponse:
+        """Render a prompt template and request a JSON response from Gemini."""
+
+        contents, config = self._build_json_request(
+            template_name,
+            context,
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
+            system_prompt=system_prompt,
+            response_schema=response_schema,
+        )
+
+        # Stream the reply and stop reading as soon as the top-level JSON value
+        # closes, rather than waiting for the server to finish the generation.
+        chunks: List[str] = []
+        tracker = _JsonCompletionTracker()
         try:
-            response = self._get_client().models.generate_content(
+            stream = self._get_client().models.generate_content_stream(
                 model=model or self.default_model,
                 contents=contents,
-                config=types.GenerateContentConfig(**config_kwargs),
+                config=config,
             )
+            try:
+                for chunk in stream:
+                    text = chunk.text or ""
+                    chunks.append(text)
+                    if tracker.feed(text):
+                        break
+            finally:
+                close = getattr(stream, "close", None)
+                if callable(close):
+                    close()
         except Exception as exc:  # noqa: BLE001 - surface API issues with context
             raise GeminiClientError(f"Gemini API error: {exc}") from exc
 
-        parsed = self.parse_json_response(response.text or "")
-        return GeminiJsonResponse(raw_text=response.text or "", data=parsed)
+        return self._json_response_from_chunks(chunks, tracker)
 
     def generate_structured_response(
             self,
@@ -188,6 +344,8 @@ class GeminiClient:
     ) -> BaseModel:
         """Render a prompt template and request a structured response from Gemini."""
 
+        types = _genai_types()
+
         prompt_template = self._load_prompt(template_name)
         try:
             prompt = prompt_template.format(**context)
@@ -307,6 +465,8 @@ class GeminiClient:
     ) -> str:
         """Generate raw text from Gemini while reusing configuration plumbing."""
 
+        types = _genai_types()
+
         if system_prompt:
             contents: Any = [
                 types.Content(role="user", parts=[types.Part.from_text(system_prompt.strip())]),
@@ -8,7 +8,7 @@ import logging
 import os
 import time
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Callable
 
@@ -493,7 +493,7 @@ class AgentResearcher:
             f"Research current trends and insights for {segment_name}.",
         )
 
-        timestamp = datetime.utcnow().isoformat()
+        timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
         result: Dict[str, Any] = {
             "segment_name": segment_name,
             "mission": mission,
@@ -523,7 +523,7 @@ class AgentResearcher:
                 result.update(synthesis)
 
             result["status"] = "completed"
-            result["completed_at"] = datetime.utcnow().isoformat()
+            result["completed_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
             result["stats"] = {
                 "queries_generated": len(queries),
                 "sources_found": len(deduped_sources),
@@ -543,7 +543,7 @@ class AgentResearcher:
         except Exception as exc:  # noqa: BLE001
             result["status"] = "failed"
             result["error"] = str(exc)
-            result["completed_at"] = datetime.utcnow().isoformat()
+            result["completed_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
             logger.exception(
                 "Agent research workflow failed",
                 extra={
@@ -9,9 +9,12 @@ from pydantic import BaseModel, ConfigDict, Field
 
 
 class PreScoreResult(BaseModel):
-    """Validated Gemini response for Reddit pre-scoring."""
+    """Validated Gemini response for Reddit pre-scoring.
 
-    model_config = ConfigDict(extra="ignore")
+    Frozen because cached results are shared between callers.
+    """
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     post_id: str
     score: float
@@ -0,0 +1,161 @@
+"""Cache for deterministic Reddit pre-score results.
+
+Scraping keeps resurfacing the same posts, and a post scored with the same
+segment prompt and model gets (near enough) the same result. Results are kept
+in a process-wide LRU and, when ``PRESCORE_CACHE_PATH`` is set, persisted to a
+SQLite file so that repeated local or scheduled runs skip posts they have
+already scored. Entries expire after ``_TTL_SECONDS``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Mapping, Optional, Tuple
+
+from intelligence.models import PreScoreResult
+
+logger = logging.getLogger(__name__)
+
+_MEMORY_MAXSIZE = 4096
+_TTL_SECONDS = 7 * 24 * 3600
+
+
+@lru_cache(maxsize=32)
+def _template_digest(template: str) -> str:
+    return hashlib.blake2b(template.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def prescore_cache_key(
+    segment_context: Mapping[str, Any],
+    template_name: str,
+    template: str,
+    title: str,
+    content: str,
+    model: str,
+) -> str:
+    """Return the cache key for a stripped post scored against a segment.
+
+    ``segment_context`` holds the segment-constant prompt fields as rendered
+    (name, audience, priorities) and ``template`` the prompt template text, so
+    editing either misses results scored under the old prompt. ``template_name``
+    keeps results from different scoring prompts (the single-post and batch
+    paths) from answering for each other.
+    """
+
+    payload = json.dumps(
+        {
+            "template": template_name,
+            "template_digest": _template_digest(template),
+            "segment": dict(segment_context),
+            "model": model,
+            "title": title,
+            "content": content,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class PreScoreCache:
+    """Thread-safe, expiring LRU of ``PreScoreResult`` objects with optional SQLite backing."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        *,
+        maxsize: int = _MEMORY_MAXSIZE,
+        ttl: float = _TTL_SECONDS,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, PreScoreResult]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if path:
+            try:
+                self._db = sqlite3.connect(path, check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS prescore "
+                    "(key TEXT PRIMARY KEY, payload TEXT NOT NULL, expires_at REAL NOT NULL)"
+                )
+                self._db.commit()
+            except sqlite3.Error as exc:
+                logger.warning(
+                    "Pre-score cache file unavailable; using memory only",
+                    extra={"operation": "prescore_cache", "path": path, "error": str(exc)},
+                )
+                self._db = None
+
+    def get(self, key: str) -> Optional[PreScoreResult]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, result = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    return result
+                del self._entries[key]
+            if self._db is None:
+                return None
+            try:
+                row = self._db.execute(
+                    "SELECT payload, expires_at FROM prescore WHERE key = ? AND expires_at > ?",
+                    (key, now),
+                ).fetchone()
+            except sqlite3.Error as exc:
+                self._log_db_error("get", exc)
+                return None
+            if row is None:
+                return None
+            result = PreScoreResult.model_validate_json(row[0])
+            self._store(key, row[1], result)
+            return result
+
+    def set(self, key: str, result: PreScoreResult) -> None:
+        expires_at = time.time() + self.ttl
+        with self._lock:
+            self._store(key, expires_at, result)
+            if self._db is None:
+                return
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO prescore (key, payload, expires_at) VALUES (?, ?, ?)",
+                    (key, result.model_dump_json(), expires_at),
+                )
+                self._db.commit()
+            except sqlite3.Error as exc:
+                self._log_db_error("set", exc)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _log_db_error(action: str, exc: sqlite3.Error) -> None:
+        logger.warning(
+            "Pre-score cache file %s failed; treating as a miss",
+            action,
+            extra={"operation": "prescore_cache", "error": str(exc)},
+        )
+
+    def _store(self, key: str, expires_at: float, result: PreScoreResult) -> None:
+        self._entries[key] = (expires_at, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+cache = PreScoreCache(os.environ.get("PRESCORE_CACHE_PATH"))
+
+
+__all__ = ["PreScoreCache", "cache", "prescore_cache_key"]
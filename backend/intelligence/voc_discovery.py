@@ -35,6 +35,18 @@ def _load_intelligence_config() -> Dict[str, Any]:
         return {}
 
 
+def _merge_config(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """Overlay ``override`` on ``base`` one level deep without copying untouched values."""
+    merged = {**base}
+    for key, value in override.items():
+        base_value = base.get(key)
+        if isinstance(value, dict) and isinstance(base_value, dict):
+            merged[key] = {**base_value, **value}
+        else:
+            merged[key] = value
+    return merged
+
+
 def run_voc_discovery(
     segment_name: str,
     segment_config: Optional[Dict[str, Any]] = None,
@@ -71,9 +83,13 @@ def run_voc_discovery(
                 f"Loading config from file for segment: {segment_name}",
                 extra={"segment_name": segment_name, "operation": "voc_discovery"},
             )
-        config = segment_config or load_segment_config(segment_name)
+        base_config = load_segment_config(segment_name)
     except FileNotFoundError as exc:
-        raise VOCDiscoveryError(str(exc)) from exc
+        if not segment_config:
+            raise VOCDiscoveryError(str(exc)) from exc
+        base_config = {}
+
+    config = _merge_config(base_config, segment_config) if segment_config else base_config
 
     logger.debug(
         f"Final config subreddits: {config.get('subreddits', [])}",
@@ -119,16 +135,13 @@ def run_voc_discovery(
     warnings.extend(reddit_warnings)
     log(f"Collected {len(reddit_posts)} candidate Reddit posts")
 
-    enriched_posts: List[Dict[str, Any]] = []
     enrich_start = time.perf_counter()
-    for post in reddit_posts:
-        enriched, post_warnings = collector.enrich_post(
-            post,
-            segment_name=segment_name,
-            segment_config=config,
-        )
-        warnings.extend(post_warnings)
-        enriched_posts.append(enriched)
+    enriched_posts, enrich_warnings = collector.enrich_posts(
+        reddit_posts,
+        segment_name=segment_name,
+        segment_config=config,
+    )
+    warnings.extend(enrich_warnings)
     logger.info(
         "Reddit enrichment completed",
         extra={
@@ -141,6 +154,9 @@ def run_voc_discovery(
 
     processed_ids = [post.get("id") for post in enriched_posts]
     history_store.mark(segment_name, [pid for pid in processed_ids if pid])
+    # mark() only buffers; persist now so a later failure in this run (no
+    # Trends data, query generation) cannot leave the IDs to the daemon thread.
+    history_store.flush()
 
     min_score = float(config.get("ai_min_score", 6.0))
     logger.debug(
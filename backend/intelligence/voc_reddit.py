@@ -2,18 +2,24 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
 import time
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from dataclasses import asdict, dataclass
-from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import requests
-from google.cloud import firestore
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from core.gemini_client import GeminiClient, GeminiClientError
 from intelligence.models import (
@@ -22,11 +28,119 @@ from intelligence.models import (
 )
 from pydantic import ValidationError
 
+if TYPE_CHECKING:
+    from google.cloud import firestore
+
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships in requirements.txt
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(value: Any, *, sort_keys: bool = False) -> bytes:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+
+else:  # pragma: no cover
+    _loads = json.loads
+
+    def _dumps(value: Any, *, sort_keys: bool = False) -> bytes:
+        return json.dumps(value, sort_keys=sort_keys, separators=(",", ":")).encode("utf-8")
+
 SCRAPECREATORS_SUBREDDIT_URL = "https://api.scrapecreators.com/v1/reddit/subreddit"
 SCRAPECREATORS_COMMENTS_URL = "https://api.scrapecreators.com/v1/reddit/post/comments"
 FIRESTORE_COLLECTION = "voc_discovery_processed_posts"
+_DOCUMENT_ID_FIELD = "__name__"
+
+_DELETED_MARKERS: frozenset[str] = frozenset(("[deleted]", "[removed]"))
+# Keys under which comment payloads nest further comments, in visiting order.
+_COMMENT_CHILD_KEYS: Tuple[str, ...] = ("replies", "data", "children")
+
+# Bump to invalidate every cached ScrapeCreators response.
+_CACHE_VERSION = "v1"
+_SUBREDDIT_CACHE_TTL_SECONDS = 300
+_COMMENTS_CACHE_TTL_SECONDS = 900
+_VALIDATOR_CACHE_TTL_SECONDS = 3600
+_HISTORY_FLUSH_INTERVAL_SECONDS = 2.0
+_HISTORY_SCAN_LIMIT = 10_000
+
+
+class _TTLCache:
+    """Small thread-safe in-process cache with per-entry expiry."""
+
+    def __init__(self, maxsize: int = 512) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared across collectors: listings and comment threads change slowly, and
+# segments often monitor the same subreddits.
+_response_cache = _TTLCache()
+# (ETag, Last-Modified, posts) for listings, kept well past the response TTL
+# so expired entries can be revalidated with a conditional GET.
+_validator_cache = _TTLCache(maxsize=256)
+
+
+def _listing_children(payload: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+    data = payload.get("data")
+    if isinstance(data, dict) and isinstance(data.get("children"), list):
+        return [child.get("data", {}) for child in data["children"] if isinstance(child, dict)]
+    return None
+
+
+_ListingExtractor = Callable[[Dict[str, Any]], Optional[List[Dict[str, Any]]]]
+
+# Listing payload shapes we accept from ScrapeCreators, tried in order.
+_LISTING_EXTRACTORS: Tuple[Tuple[str, _ListingExtractor], ...] = (
+    ("data", lambda payload: payload["data"] if isinstance(payload.get("data"), list) else None),
+    ("posts", lambda payload: payload["posts"] if isinstance(payload.get("posts"), list) else None),
+    ("data.children", _listing_children),
+)
+
+
+def _int_or_zero(value: Any) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _extract_listing_posts(payload: Any) -> List[Dict[str, Any]]:
+    if isinstance(payload, list):
+        return payload
+    if isinstance(payload, dict):
+        for _, extractor in _LISTING_EXTRACTORS:
+            posts = extractor(payload)
+            if posts is not None:
+                return posts
+    return []
 
 
 @dataclass(slots=True)
@@ -35,49 +149,175 @@ class RedditFilters:
     min_comments: int = 0
     time_range: str = "month"
     sort: str = "top"
+    # Fetch all subreddits as one "a+b+c" listing; opt-in because the shared
+    # listing is capped like a single subreddit's.
+    combine_subreddits: bool = False
+
+
+def _create_firestore_client() -> firestore.Client:
+    # Imported lazily: the Firestore SDK is slow to import on cold start.
+    from google.cloud import firestore
+
+    return firestore.Client()
 
 
 class RedditHistoryStore:
     """Handles Firestore + in-memory history for processed posts."""
 
-    def __init__(self, client: Optional[firestore.Client] = None) -> None:
-        self.client = client
-        self._cache: Dict[str, set[str]] = {}
+    def __init__(
+        self,
+        client: Optional[firestore.Client] = None,
+        *,
+        client_factory: Optional[Callable[[], firestore.Client]] = None,
+    ) -> None:
+        self._client = client
+        self._client_factory = client_factory
+        self._client_lock = threading.Lock()
+        # Frozen so load() can hand out the cached set without copying it.
+        self._cache: Dict[str, frozenset[str]] = {}
+        self._fully_loaded: set[str] = set()
+        self._aggregate_loaded: set[str] = set()
+        self._pending: Dict[str, set[str]] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_thread: Optional[threading.Thread] = None
 
     @classmethod
     def create(cls) -> "RedditHistoryStore":
+        # The Firestore client does auth discovery on construction, so it is
+        # only built once history is actually read or written.
+        return cls(client_factory=_create_firestore_client)
+
+    @property
+    def client(self) -> Optional[firestore.Client]:
+        if self._client is None and self._client_factory is not None:
+            with self._client_lock:
+                if self._client is None and self._client_factory is not None:
+                    factory, self._client_factory = self._client_factory, None
+                    try:
+                        self._client = factory()
+                        logger.debug(
+                            "Initialized Firestore client for history store",
+                            extra={"operation": "reddit_history_init"},
+                        )
+                    except Exception as exc:  # noqa: BLE001 - optional dependency
+                        logger.warning(
+                            "Firestore unavailable for VOC history: %s",
+                            exc,
+                            extra={"operation": "reddit_history_init"},
+                        )
+        return self._client
+
+    def _segment_document(self, segment_name: str) -> Any:
+        return self.client.collection(FIRESTORE_COLLECTION).document(segment_name)
+
+    def _segment_collection(self, segment_name: str) -> Any:
+        # Legacy layout: one document per processed post.
+        return self._segment_document(segment_name).collection("posts")
+
+    def _remember(self, segment_name: str, ids: Iterable[str]) -> None:
+        self._cache[segment_name] = self._cache.get(segment_name, frozenset()).union(ids)
+
+    def _load_aggregate(self, segment_name: str) -> None:
+        """Read the segment's ``processed_ids`` array into the cache (one read)."""
+        if segment_name in self._aggregate_loaded:
+            return
         try:
-            client = firestore.Client()
-            logger.debug(
-                "Initialized Firestore client for history store",
-                extra={"operation": "reddit_history_init"},
-            )
-        except Exception as exc:  # noqa: BLE001 - optional dependency
+            snapshot = self._segment_document(segment_name).get()
+        except Exception as exc:  # noqa: BLE001
             logger.warning(
-                "Firestore unavailable for VOC history: %s",
+                "Failed to load Firestore history for '%s': %s",
+                segment_name,
                 exc,
-                extra={"operation": "reddit_history_init"},
+                extra={"operation": "reddit_history_load", "segment_name": segment_name},
             )
-            client = None
-        return cls(client)
-
-    def load(self, segment_name: str) -> set[str]:
-        if segment_name in self._cache:
-            return set(self._cache[segment_name])
-
-        if not self.client:
-            self._cache.setdefault(segment_name, set())
-            return set()
+            return
+        data = (snapshot.to_dict() or {}) if snapshot.exists else {}
+        self._remember(segment_name, data.get("processed_ids") or ())
+        self._aggregate_loaded.add(segment_name)
 
-        collection = (
+    def _analysis_collection(self, segment_name: str) -> Any:
+        # Kept apart from "posts": any document there counts as processed.
+        return (
             self.client.collection(FIRESTORE_COLLECTION)
             .document(segment_name)
-            .collection("posts")
+            .collection("analysis")
         )
 
+    def get_analysis(
+        self, segment_name: str, post_id: str, prompt_hash: str
+    ) -> Optional[Dict[str, Any]]:
+        """Return a cached Gemini analysis when it was produced from the same prompt."""
+        if not self.client or not post_id:
+            return None
+
+        try:
+            snapshot = self._analysis_collection(segment_name).document(post_id).get()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(
+                "Failed to read cached analysis for post '%s': %s",
+                post_id,
+                exc,
+                extra={"operation": "reddit_analysis_cache", "segment_name": segment_name},
+            )
+            return None
+
+        if not snapshot.exists:
+            return None
+        data = snapshot.to_dict() or {}
+        if data.get("prompt_hash") != prompt_hash:
+            return None
+        return data.get("ai_analysis")
+
+    def save_analysis(
+        self,
+        segment_name: str,
+        post_id: str,
+        prompt_hash: str,
+        analysis: Dict[str, Any],
+    ) -> None:
+        if not self.client or not post_id:
+            return
+
+        try:
+            self._analysis_collection(segment_name).document(post_id).set(
+                {"ai_analysis": analysis, "prompt_hash": prompt_hash}
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(
+                "Failed to cache analysis for post '%s': %s",
+                post_id,
+                exc,
+                extra={"operation": "reddit_analysis_cache", "segment_name": segment_name},
+            )
+
+    def load(self, segment_name: str) -> frozenset[str]:
+        """Return every processed ID for a segment by scanning its full history.
+
+        Besides the aggregated array this streams the newest legacy per-post
+        documents (up to ``FIRESTORE_HISTORY_LIMIT``), one read each, so it is
+        only used as an opt-in warm-up; per-run dedupe goes through
+        :meth:`filter_unseen`.
+        """
+        if segment_name in self._fully_loaded or not self.client:
+            return self._cache.get(segment_name, frozenset())
+
+        self._load_aggregate(segment_name)
+        collection = self._segment_collection(segment_name)
+
+        from google.cloud import firestore
+
+        limit = int(os.environ.get("FIRESTORE_HISTORY_LIMIT", _HISTORY_SCAN_LIMIT))
+        # Only IDs are needed; an empty projection would return every field.
+        # RunQuery streams every page over one RPC, so the limit (newest
+        # first) is what bounds the scan.
+        query = (
+            collection.select([_DOCUMENT_ID_FIELD])
+            .order_by("processed_at", direction=firestore.Query.DESCENDING)
+            .limit(limit)
+        )
         processed: set[str] = set()
         try:
-            for doc in collection.stream():  # type: ignore[attr-defined]
+            for doc in query.stream():  # type: ignore[attr-defined]
                 processed.add(doc.id)
         except Exception as exc:  # noqa: BLE001
             logger.warning(
@@ -86,40 +326,103 @@ class RedditHistoryStore:
                 exc,
                 extra={"operation": "reddit_history_load", "segment_name": segment_name},
             )
-            processed = set()
+            return self._cache.get(segment_name, frozenset())
+
+        self._remember(segment_name, processed)
+        if len(processed) < limit:
+            # Older IDs may exist beyond the limit; filter_unseen keeps checking them.
+            self._fully_loaded.add(segment_name)
+        return self._cache[segment_name]
+
+    def filter_unseen(self, segment_name: str, candidate_ids: Iterable[str]) -> set[str]:
+        """Return the subset of ``candidate_ids`` that has not been processed yet.
+
+        The segment's aggregated ``processed_ids`` array is read once; any
+        candidates it doesn't cover are checked against the legacy per-post
+        documents with one batched ``get_all``.
+        """
+        ids = [pid for pid in dict.fromkeys(candidate_ids) if pid]
+        if self.client:
+            self._load_aggregate(segment_name)
+        cache = self._cache.get(segment_name, frozenset())
+        unknown = [pid for pid in ids if pid not in cache]
+        if not unknown or not self.client or segment_name in self._fully_loaded:
+            return set(unknown)
+
+        # Posts processed before the aggregated array existed only have
+        # per-post documents, so check the remaining candidates there.
+
+        collection = self._segment_collection(segment_name)
+        try:
+            snapshots = self.client.get_all([collection.document(pid) for pid in unknown])
+            # get_all does not guarantee ordering, so match snapshots by ID.
+            seen = {snapshot.id for snapshot in snapshots if snapshot.exists}
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(
+                "Failed to check Firestore history for '%s': %s",
+                segment_name,
+                exc,
+                extra={"operation": "reddit_history_load", "segment_name": segment_name},
+            )
+            return set(unknown)
 
-        self._cache[segment_name] = processed
-        return set(processed)
+        self._remember(segment_name, seen)
+        return {pid for pid in unknown if pid not in seen}
 
     def mark(self, segment_name: str, post_ids: Iterable[str]) -> None:
+        """Record IDs as processed; Firestore writes are buffered and flushed in the background."""
         ids = {pid for pid in post_ids if pid}
         if not ids:
             return
 
-        cache = self._cache.setdefault(segment_name, set())
-        cache.update(ids)
+        self._remember(segment_name, ids)
 
         if not self.client:
             return
 
-        batch = self.client.batch()
-        segment_collection = (
-            self.client.collection(FIRESTORE_COLLECTION)
-            .document(segment_name)
-            .collection("posts")
-        )
-        timestamp = datetime.utcnow().isoformat()
-        for pid in ids:
-            batch.set(segment_collection.document(pid), {"processed_at": timestamp})
+        with self._pending_lock:
+            self._pending.setdefault(segment_name, set()).update(ids)
+            if self._flush_thread is None or not self._flush_thread.is_alive():
+                self._flush_thread = threading.Thread(
+                    target=self._flush_loop,
+                    name="reddit-history-flush",
+                    daemon=True,
+                )
+                self._flush_thread.start()
 
-        try:
-            batch.commit()
-        except Exception as exc:  # noqa: BLE001
-            logger.warning(
-                "Failed to persist Reddit history: %s",
-                exc,
-                extra={"operation": "reddit_history_persist", "segment_name": segment_name},
-            )
+    def _flush_loop(self) -> None:
+        while True:
+            time.sleep(_HISTORY_FLUSH_INTERVAL_SECONDS)
+            self.flush()
+            with self._pending_lock:
+                if not self._pending:
+                    self._flush_thread = None
+                    return
+
+    def flush(self) -> None:
+        """Write every buffered ID to Firestore now, one write per segment."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        if not pending or not self.client:
+            return
+
+        from google.cloud import firestore
+
+        for segment_name, ids in pending.items():
+            try:
+                self._segment_document(segment_name).set(
+                    {
+                        "processed_ids": firestore.ArrayUnion(sorted(ids)),
+                        "updated_at": firestore.SERVER_TIMESTAMP,
+                    },
+                    merge=True,
+                )
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(
+                    "Failed to persist Reddit history: %s",
+                    exc,
+                    extra={"operation": "reddit_history_persist", "segment_name": segment_name},
+                )
 
 
 class RedditDataCollector:
@@ -143,6 +446,24 @@ class RedditDataCollector:
             prompt_dir or Path(__file__).resolve().parent / "config" / "prompts"
         )
         self.advanced_model = os.environ.get("MODEL_PRO", self.gemini.default_model)
+        self._session = self._build_session(api_key)
+
+    @staticmethod
+    def _build_session(api_key: str) -> requests.Session:
+        """Keep-alive session shared by every ScrapeCreators call of this collector."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+            ),
+        )
+        session.mount("https://", adapter)
+        session.headers.update({"x-api-key": api_key, "User-Agent": "content-finder/1.0"})
+        return session
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -155,6 +476,7 @@ class RedditDataCollector:
             min_comments=int(filters.get("min_comments", 0)),
             time_range=str(filters.get("time_range", "month")),
             sort=str(filters.get("sort", "top")),
+            combine_subreddits=bool(filters.get("combine_subreddits", False)),
         )
 
     def _fetch_subreddit(
@@ -163,7 +485,16 @@ class RedditDataCollector:
         *,
         filters: RedditFilters,
     ) -> Sequence[Dict[str, Any]]:
-        headers = {"x-api-key": self.api_key}
+        cache_key = f"{_CACHE_VERSION}:sub:{subreddit}:{filters.time_range}:{filters.sort}"
+        cached_posts = _response_cache.get(cache_key)
+        if cached_posts is not None:
+            logger.debug(
+                "Using cached listing for r/%s",
+                subreddit,
+                extra={"operation": "reddit_fetch", "subreddit": subreddit},
+            )
+            return cached_posts
+
         params = {"subreddit": subreddit, "timeframe": filters.time_range, "sort": filters.sort}
 
         logger.info(
@@ -174,62 +505,41 @@ class RedditDataCollector:
                 "filters": params,
             },
         )
+        # After the short TTL lapses, revalidate the last body instead of
+        # downloading it again when the API hands out validators.
+        validated = _validator_cache.get(cache_key)
+        conditional_headers: Dict[str, str] = {}
+        if validated is not None:
+            etag, last_modified, _ = validated
+            if etag:
+                conditional_headers["If-None-Match"] = etag
+            if last_modified:
+                conditional_headers["If-Modified-Since"] = last_modified
+
         start_time = time.perf_counter()
-        response = requests.get(
+        response = self._session.get(
             SCRAPECREATORS_SUBREDDIT_URL,
-            headers=headers,
             params=params,
+            headers=conditional_headers or None,
             timeout=30,
         )
         response.raise_for_status()
         duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
 
-        payload = response.json() if response.content else {}
-        if isinstance(payload, dict):
-            if isinstance(payload.get("data"), list):
-                posts = payload["data"]
-                logger.info(
-                    "API returned %s posts from r/%s",
-                    len(posts),
-                    subreddit,
-                    extra={
-                        "operation": "reddit_fetch",
-                        "subreddit": subreddit,
-                        "duration_ms": duration_ms,
-                    },
-                )
-                logger.debug(
-                    "Sample post IDs: %s",
-                    [p.get("id") for p in posts[:3]],
-                    extra={
-                        "operation": "reddit_fetch",
-                        "subreddit": subreddit,
-                    },
-                )
-                return posts
-            if isinstance(payload.get("posts"), list):
-                posts = payload["posts"]
-                logger.info(
-                    "API returned %s posts from r/%s",
-                    len(posts),
-                    subreddit,
-                    extra={
-                        "operation": "reddit_fetch",
-                        "subreddit": subreddit,
-                        "duration_ms": duration_ms,
-                    },
-                )
-                logger.debug(
-                    "Sample post IDs: %s",
-                    [p.get("id") for p in posts[:3]],
-                    extra={
-                        "operation": "reddit_fetch",
-                        "subreddit": subreddit,
-                    },
-                )
-                return posts
+        if response.status_code == 304 and validated is not None:
+            posts = validated[2]
+        else:
+            payload = _loads(response.content) if response.content else {}
+            posts = _extract_listing_posts(payload)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            _validator_cache.set(
+                cache_key, (etag, last_modified, posts), _VALIDATOR_CACHE_TTL_SECONDS
+            )
         logger.info(
-            "API returned 0 posts from r/%s",
+            "API returned %s posts from r/%s",
+            len(posts),
             subreddit,
             extra={
                 "operation": "reddit_fetch",
@@ -237,7 +547,93 @@ class RedditDataCollector:
                 "duration_ms": duration_ms,
             },
         )
-        return []
+        if posts:
+            logger.debug(
+                "Sample post IDs: %s",
+                [p.get("id") for p in posts[:3]],
+                extra={
+                    "operation": "reddit_fetch",
+                    "subreddit": subreddit,
+                },
+            )
+        _response_cache.set(cache_key, posts, _SUBREDDIT_CACHE_TTL_SECONDS)
+        return posts
+
+    def _fetch_comments(self, url: str) -> Any:
+        cache_key = (
+            f"{_CACHE_VERSION}:comments:"
+            f"{hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()}"
+        )
+        cached_payload = _response_cache.get(cache_key)
+        if cached_payload is not None:
+            return cached_payload
+
+        response = self._session.get(
+            SCRAPECREATORS_COMMENTS_URL,
+            params={"url": url},
+            timeout=30,
+        )
+        response.raise_for_status()
+        payload = _loads(response.content) if response.content else {}
+        _response_cache.set(cache_key, payload, _COMMENTS_CACHE_TTL_SECONDS)
+        return payload
+
+    def _fetch_combined_subreddits(
+        self,
+        subreddits: Sequence[str],
+        *,
+        filters: RedditFilters,
+    ) -> Optional[List[Tuple[str, Sequence[Dict[str, Any]], Optional[Exception]]]]:
+        """Fetch ``subreddits`` as one multi-subreddit listing, grouped per subreddit.
+
+        Returns ``None`` when the combined request fails or comes back empty so
+        the caller can fall back to one request per subreddit.
+        """
+        combined_name = "+".join(subreddits)
+        try:
+            posts = self._fetch_subreddit(combined_name, filters=filters)
+        except (requests.RequestException, json.JSONDecodeError) as exc:
+            logger.warning(
+                "Combined subreddit fetch failed, falling back to per-subreddit requests: %s",
+                exc,
+                extra={"operation": "reddit_fetch", "subreddit": combined_name},
+            )
+            return None
+        if not posts:
+            return None
+
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for post in posts:
+            grouped.setdefault(post.get("subreddit") or combined_name, []).append(post)
+        return [(name, group, None) for name, group in grouped.items()]
+
+    def _fetch_subreddits(
+        self,
+        subreddits: Sequence[str],
+        *,
+        filters: RedditFilters,
+        max_workers: int = 8,
+    ) -> List[Tuple[str, Sequence[Dict[str, Any]], Optional[Exception]]]:
+        """Fetch every subreddit listing concurrently, in input order.
+
+        Each result carries the request error instead of raising so one bad
+        subreddit doesn't discard the others.
+        """
+
+        if filters.combine_subreddits and len(subreddits) > 1:
+            combined = self._fetch_combined_subreddits(subreddits, filters=filters)
+            if combined is not None:
+                return combined
+
+        def fetch(subreddit: str) -> Tuple[str, Sequence[Dict[str, Any]], Optional[Exception]]:
+            try:
+                return subreddit, self._fetch_subreddit(subreddit, filters=filters), None
+            except (requests.RequestException, json.JSONDecodeError) as exc:
+                return subreddit, [], exc
+
+        worker_count = max(1, min(max_workers, len(subreddits)))
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            return list(executor.map(fetch, subreddits))
 
     # ------------------------------------------------------------------
     # Public API
@@ -276,7 +672,8 @@ class RedditDataCollector:
                 "filters": asdict(filters),
             },
         )
-        processed_ids = self.history_store.load(segment_name)
+        if os.environ.get("FIRESTORE_FULL_SCAN") == "1":
+            self.history_store.load(segment_name)
 
         curated: List[Dict[str, Any]] = []
         raw_unfiltered: List[Dict[str, Any]] = []  # NEW: Store ALL posts before filtering
@@ -286,10 +683,9 @@ class RedditDataCollector:
             if log_callback:
                 log_callback(message, level)
 
-        for subreddit in subreddits:
-            try:
-                posts = self._fetch_subreddit(subreddit, filters=filters)
-            except requests.RequestException as exc:
+        fetched: List[Tuple[str, Sequence[Dict[str, Any]]]] = []
+        for subreddit, posts, exc in self._fetch_subreddits(subreddits, filters=filters):
+            if exc is not None:
                 warning = f"Failed to fetch subreddit '{subreddit}': {exc}"
                 logger.warning(
                     warning,
@@ -304,11 +700,36 @@ class RedditDataCollector:
                 continue
 
             log(f"Fetched {len(posts)} posts from r/{subreddit}")
-            
+            fetched.append((subreddit, posts))
+
+        # Dedupe against history once, using only the IDs we actually fetched.
+        unseen_ids = frozenset(
+            self.history_store.filter_unseen(
+                segment_name,
+                (
+                    str(post.get("id") or post.get("post_id") or "")
+                    for _, posts in fetched
+                    for post in posts
+                ),
+            )
+        )
+        # Crossposts show up in several listings; only score each post once.
+        batch_seen: set[str] = set()
+        raw_seen: set[str] = set()
+        min_score = filters.min_score
+        min_comments = filters.min_comments
+
+        for subreddit, posts in fetched:
             # NEW: Store ALL raw posts before any filtering
             for post in posts:
+                raw_id = str(post.get("id") or post.get("post_id") or "")
+                if raw_id:
+                    # Crossposts would otherwise be listed (and pre-scored) once per subreddit.
+                    if raw_id in raw_seen:
+                        continue
+                    raw_seen.add(raw_id)
                 raw_unfiltered.append({
-                    "id": str(post.get("id") or post.get("post_id") or ""),
+                    "id": raw_id,
                     "title": post.get("title", ""),
                     "url": post.get("url"),
                     "permalink": post.get("permalink"),
@@ -320,51 +741,23 @@ class RedditDataCollector:
                 })
             
             # Continue with existing filtering logic
+            skipped = filtered_score = filtered_comments = passed = 0
             for post in posts:
                 post_id = str(post.get("id") or post.get("post_id") or "")
-                if not post_id or post_id in processed_ids:
+                if not post_id or post_id not in unseen_ids or post_id in batch_seen:
+                    skipped += 1
                     continue
-                if int(post.get("score", 0)) < filters.min_score:
-                    logger.debug(
-                        "Post %s: score=%s, min_score=%s, filtered=True",
-                        post_id,
-                        post.get("score"),
-                        filters.min_score,
-                        extra={
-                            "operation": "reddit_filter",
-                            "segment_name": segment_name,
-                            "subreddit": subreddit,
-                            "post_id": post_id,
-                        },
-                    )
+                batch_seen.add(post_id)
+                score = _int_or_zero(post.get("score"))
+                num_comments = _int_or_zero(post.get("num_comments"))
+                if score < min_score:
+                    filtered_score += 1
                     continue
-                if int(post.get("num_comments", 0)) < filters.min_comments:
-                    logger.debug(
-                        "Post %s: score=%s, min_comments=%s, filtered=True",
-                        post_id,
-                        post.get("score"),
-                        filters.min_comments,
-                        extra={
-                            "operation": "reddit_filter",
-                            "segment_name": segment_name,
-                            "subreddit": subreddit,
-                            "post_id": post_id,
-                        },
-                    )
+                if num_comments < min_comments:
+                    filtered_comments += 1
                     continue
+                passed += 1
 
-                logger.debug(
-                    "Post %s: score=%s, min_score=%s, filtered=False",
-                    post_id,
-                    post.get("score"),
-                    filters.min_score,
-                    extra={
-                        "operation": "reddit_filter",
-                        "segment_name": segment_name,
-                        "subreddit": subreddit,
-                        "post_id": post_id,
-                    },
-                )
                 curated.append(
                     {
                         "id": post_id,
@@ -372,15 +765,34 @@ class RedditDataCollector:
                         "url": post.get("url"),
                         "permalink": post.get("permalink"),
                         "created_utc": post.get("created_utc"),
-                        "score": post.get("score", 0),
-                        "num_comments": post.get("num_comments", 0),
+                        "score": score,
+                        "num_comments": num_comments,
                         "subreddit": subreddit,
                         "content_snippet": post.get("selftext", ""),
                     }
                 )
 
-        curated.sort(key=lambda item: item.get("score", 0), reverse=True)
-        raw_unfiltered.sort(key=lambda item: item.get("score", 0), reverse=True)
+            # One summary per subreddit instead of a log record per post.
+            logger.debug(
+                "Filter summary for r/%s",
+                subreddit,
+                extra={
+                    "operation": "reddit_filter",
+                    "segment_name": segment_name,
+                    "subreddit": subreddit,
+                    "skipped_processed_or_duplicate": skipped,
+                    "filtered_score": filtered_score,
+                    "filtered_comments": filtered_comments,
+                    "passed": passed,
+                    "min_score": min_score,
+                    "min_comments": min_comments,
+                },
+            )
+
+        # Every curated/raw entry carries a "score" key, so itemgetter is safe.
+        by_score = itemgetter("score")
+        curated.sort(key=by_score, reverse=True)
+        raw_unfiltered.sort(key=by_score, reverse=True)
         return curated, raw_unfiltered, warnings
 
     def enrich_post(
@@ -390,7 +802,6 @@ class RedditDataCollector:
         segment_name: str,
         segment_config: Dict[str, Any],
     ) -> Tuple[Dict[str, Any], List[str]]:
-        headers = {"x-api-key": self.api_key}
         warnings: List[str] = []
         logger.info(
             "Starting post enrichment",
@@ -406,14 +817,7 @@ class RedditDataCollector:
         if post.get("url"):
             try:
                 start_time = time.perf_counter()
-                response = requests.get(
-                    SCRAPECREATORS_COMMENTS_URL,
-                    headers=headers,
-                    params={"url": post["url"]},
-                    timeout=30,
-                )
-                response.raise_for_status()
-                comments_payload = response.json() if response.content else {}
+                comments_payload = self._fetch_comments(post["url"])
                 logger.info(
                     "Comments fetched successfully",
                     extra={
@@ -424,7 +828,7 @@ class RedditDataCollector:
                         "duration_ms": round((time.perf_counter() - start_time) * 1000, 2),
                     },
                 )
-            except requests.RequestException as exc:
+            except (requests.RequestException, json.JSONDecodeError) as exc:
                 warning = f"Failed to fetch comments for post '{post.get('id')}': {exc}"
                 logger.warning(
                     warning,
@@ -446,14 +850,24 @@ class RedditDataCollector:
                 "subreddit": post.get("subreddit", ""),
                 "discussion_text": discussion_text,
             }
-            gemini_request_payload = {
-                "template_name": "voc_reddit_analysis_prompt.txt",
-                "context": prompt_context,
-                "model": self.advanced_model,
-                "temperature": 0.0,
-                "max_output_tokens": 2048,
-                "response_schema": deepcopy(REDDIT_ANALYSIS_RESPONSE_SCHEMA),
-            }
+            prompt_hash = self._analysis_prompt_hash(
+                "voc_reddit_analysis_prompt.txt", prompt_context, self.advanced_model
+            )
+            cached_analysis = self.history_store.get_analysis(
+                segment_name, post.get("id", ""), prompt_hash
+            )
+            if cached_analysis is not None:
+                logger.info(
+                    "Reusing cached deep analysis",
+                    extra={
+                        "operation": "reddit_enrich",
+                        "segment_name": segment_name,
+                        "post_id": post.get("id"),
+                    },
+                )
+                post["ai_analysis"] = cached_analysis
+                return post, warnings
+
             logger.info(
                 "Sending deep analysis request to Gemini",
                 extra={
@@ -513,6 +927,9 @@ class RedditDataCollector:
                 warnings.append(warning)
             else:
                 post["ai_analysis"] = analysis.model_dump()
+                self.history_store.save_analysis(
+                    segment_name, post.get("id", ""), prompt_hash, post["ai_analysis"]
+                )
         except (GeminiClientError, FileNotFoundError) as exc:
             warning = f"Gemini Reddit analysis failed for post '{post.get('id')}': {exc}"
             logger.error(
@@ -542,6 +959,71 @@ class RedditDataCollector:
 
         return post, warnings
 
+    def enrich_posts(
+        self,
+        posts: Sequence[Dict[str, Any]],
+        *,
+        segment_name: str,
+        segment_config: Dict[str, Any],
+        max_workers: int = 8,
+    ) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Enrich posts concurrently, preserving input order and collecting warnings.
+
+        Each enrichment is a ScrapeCreators call followed by a Gemini call, so
+        running them on a bounded thread pool overlaps the network waits. Posts
+        whose enrichment raises are dropped and reported as warnings.
+        """
+        if not posts:
+            return [], []
+
+        def enrich(post: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], List[str]]:
+            try:
+                return self.enrich_post(
+                    post,
+                    segment_name=segment_name,
+                    segment_config=segment_config,
+                )
+            except Exception as exc:  # noqa: BLE001 - one bad post must not sink the batch
+                warning = f"Enrichment failed for post '{post.get('id') or ''}': {exc}"
+                logger.exception(
+                    warning,
+                    extra={
+                        "operation": "reddit_enrich",
+                        "segment_name": segment_name,
+                        "post_id": post.get("id"),
+                    },
+                )
+                return None, [warning]
+
+        start_time = time.perf_counter()
+        worker_count = max(1, min(max_workers, len(posts)))
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            results = list(executor.map(enrich, posts))
+
+        enriched = [post for post, _ in results if post is not None]
+        warnings = [warning for _, post_warnings in results for warning in post_warnings]
+        logger.info(
+            "Parallel enrichment finished",
+            extra={
+                "operation": "reddit_enrich",
+                "segment_name": segment_name,
+                "count": len(enriched),
+                "max_workers": worker_count,
+                "duration_ms": round((time.perf_counter() - start_time) * 1000, 2),
+            },
+        )
+        return enriched, warnings
+
+    def _analysis_prompt_hash(
+        self, template_name: str, context: Dict[str, Any], model: str
+    ) -> str:
+        """Fingerprint the template, rendered inputs and model behind an analysis."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.gemini._load_prompt(template_name).encode("utf-8"))
+        digest.update(model.encode("utf-8"))
+        digest.update(_dumps(context, sort_keys=True))
+        return digest.hexdigest()
+
     def _build_discussion_summary(self, post: Dict[str, Any], payload: Any) -> str:
         lines = [f"Title: {post.get('title', '')}"]
         body = post.get("content_snippet") or ""
@@ -556,51 +1038,62 @@ class RedditDataCollector:
     @staticmethod
     def _extract_comment_bodies(payload: Any, limit: int = 5) -> List[str]:
         bodies: List[str] = []
+        # Breadth-first, so top-level comments are collected before nested
+        # replies; iterative so deep threads can't hit the recursion limit.
+        queue = deque([payload])
+        seen: set[int] = set()
+
+        while queue:
+            node = queue.popleft()
+            if not isinstance(node, (dict, list)) or id(node) in seen:
+                continue
+            seen.add(id(node))
 
-        def _visit(node: Any) -> None:
-            if len(bodies) >= limit:
-                return
-            if isinstance(node, dict):
-                body = node.get("body")
-                if isinstance(body, str):
-                    trimmed = body.strip()
-                    if trimmed and trimmed.lower() not in {"[deleted]", "[removed]"}:
-                        bodies.append(trimmed)
-                        if len(bodies) >= limit:
-                            return
-                for key in ("replies", "data", "children"):
-                    value = node.get(key)
-                    if isinstance(value, (dict, list)):
-                        _visit(value)
-            elif isinstance(node, list):
-                for item in node:
+            if isinstance(node, list):
+                queue.extend(node)
+                continue
+
+            body = node.get("body")
+            if isinstance(body, str):
+                trimmed = body.strip()
+                if trimmed and trimmed.lower() not in _DELETED_MARKERS:
+                    bodies.append(trimmed)
                     if len(bodies) >= limit:
                         break
-                    _visit(item)
+            for key in _COMMENT_CHILD_KEYS:
+                value = node.get(key)
+                if isinstance(value, (dict, list)):
+                    queue.append(value)
 
-        _visit(payload)
-        return bodies[:limit]
+        return bodies
 
 
-def load_segment_config(segment_name: str) -> Dict[str, Any]:
-    slug = segment_name.strip().lower().replace(" ", "_")
-    config_path = (
-        Path(__file__).resolve().parent
-        / "config"
-        / "prompts"
-        / f"segment_{slug}.json"
-    )
-    if not config_path.exists():
-        raise FileNotFoundError(f"No configuration found for segment '{segment_name}'.")
+_SEGMENT_CONFIG_DIR = Path(__file__).resolve().parent / "config" / "prompts"
+
+
+@lru_cache(maxsize=64)
+def _load_segment_config_cached(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    # mtime_ns is part of the cache key so an edited file is re-read.
     logger.debug(
         "Segment config loaded",
         extra={
             "operation": "segment_config_load",
-            "segment_name": segment_name,
-            "config_path": str(config_path),
+            "config_path": path_str,
         },
     )
-    return json.loads(config_path.read_text(encoding="utf-8"))
+    with open(path_str, "rb") as handle:
+        return _loads(handle.read())
+
+
+def load_segment_config(segment_name: str) -> Dict[str, Any]:
+    slug = segment_name.strip().lower().replace(" ", "_")
+    config_path = _SEGMENT_CONFIG_DIR / f"segment_{slug}.json"
+    try:
+        config = _load_segment_config_cached(str(config_path), config_path.stat().st_mtime_ns)
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(f"No configuration found for segment '{segment_name}'.") from exc
+    # Callers are free to mutate the returned config, so never hand out the cached dict.
+    return deepcopy(config)
 
 
 __all__ = [
@@ -5,14 +5,15 @@ from __future__ import annotations
 import html
 import json
 import logging
+import re
 import time
-from copy import deepcopy
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TypedDict
 
 from pydantic import BaseModel, Field, ValidationError
 
-from core.gemini_client import GeminiClient, GeminiClientError
+from core.gemini_client import GeminiClient, GeminiClientError, GeminiJsonResponse
+from intelligence import prescore_cache
 from intelligence.models import (
     PRESCORE_RESPONSE_SCHEMA,
     PreScoreResult,
@@ -20,45 +21,92 @@ from intelligence.models import (
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships in requirements.txt
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(value: Any) -> str:
+        return orjson.dumps(value).decode("utf-8")
+
+else:  # pragma: no cover
+    _loads = json.loads
+
+    def _dumps(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
 
 class CuratedQueriesResponse(BaseModel):
     """Pydantic model for curated query generation response"""
     queries: List[str] = Field(description="List of curated search queries")
 
 
+class StrippedPost(TypedDict):
+    """Minimal post record sent to Gemini for pre-scoring."""
+
+    id: str
+    title: str
+    subreddit: str
+    score: int
+    num_comments: int
+    content: str
+
+
+# Posts per batched pre-score request, and the score from which the batch
+# path flags a post as priority (the prompt's "high relevance" band).
+_PRESCORE_BATCH_SIZE = 25
+_PRIORITY_SCORE = 7.0
+# Prompt templates for single-post and batched pre-scoring; each path caches
+# its results under its own template name.
+_PRESCORE_TEMPLATE = "voc_reddit_prescore_prompt.txt"
+_BATCH_PRESCORE_TEMPLATE = "voc_reddit_batch_prescore.txt"
+# Single-post scoring logs progress at INFO every this many scored posts.
+_PROGRESS_LOG_INTERVAL = 25
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def clean_text_for_json(text: str, max_length: int = 1500) -> str:
     """
-    Clean text to prevent JSON issues while preserving readability.
-    Handles quotes, newlines, special characters, and HTML entities.
+    Normalise post text for prompts while preserving readability.
+    Decodes HTML entities and collapses newlines, tabs and runs of whitespace.
+
+    Quotes and backslashes are left alone: batch payloads are serialised with
+    a real JSON encoder, which escapes them, and single-post prompts take the
+    text verbatim.
     
     Args:
         text: Raw text to clean
         max_length: Maximum character length (default 1500)
     
     Returns:
-        Cleaned text safe for JSON encoding
+        Cleaned, truncated text
     """
     if not text:
         return ""
-    
-    # HTML decode first (handles &amp;, &quot;, etc.)
-    text = html.unescape(text)
-    
-    # Replace problematic characters
-    text = text.replace('\r\n', ' ')  # Windows newlines
-    text = text.replace('\n', ' ')     # Unix newlines
-    text = text.replace('\t', ' ')     # Tabs
-    text = text.replace('"', "'")      # Double quotes → single (safer in JSON strings)
-    text = text.replace('\\', '')      # Remove backslashes
-    
-    # Collapse multiple spaces
-    text = ' '.join(text.split())
-    
+
+    # Most titles and snippets are already clean: no entities, no control or
+    # non-space whitespace characters (all of which fail isprintable), and no
+    # runs of spaces. Those only need trimming.
+    if text.isprintable() and "&" not in text and "  " not in text:
+        return text.strip()[:max_length].strip()
+
+    # HTML decode first (handles &amp;, &quot;, etc.; every entity starts with
+    # "&", so most snippets skip it)
+    if "&" in text:
+        text = html.unescape(text)
+
+    # Collapse newlines, tabs and runs of whitespace to single spaces
+    text = _WHITESPACE_RE.sub(" ", text).strip()
+
     # Truncate to max length
     return text[:max_length].strip()
 
 
-def _strip_post_for_prescore(post: Dict[str, Any]) -> Dict[str, Any]:
+def _strip_post_for_prescore(post: Dict[str, Any]) -> StrippedPost:
     """
     Strip Reddit post to minimal fields needed for pre-scoring.
     Reduces token usage while preserving essential context.
@@ -76,123 +124,94 @@ def _strip_post_for_prescore(post: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def pre_score_post(
-    post: Dict[str, Any],
-    segment_name: str,
-    *,
-    gemini_client: GeminiClient,
-    segment_config: Optional[Dict[str, Any]] = None,
-) -> PreScoreResult:
-    """Run Gemini pre-scoring for a single Reddit post."""
+def _format_priorities(segment_config: Dict[str, Any]) -> str:
+    """Render segment priorities as bullet lines; constant for a whole run."""
 
-    segment_config = segment_config or {}
-    stripped_post = _strip_post_for_prescore(post)
+    return "\n".join(f"• {priority}" for priority in segment_config.get("priorities", []))
 
-    context = {
+
+def _prescore_segment_context(
+    segment_name: str,
+    segment_config: Dict[str, Any],
+    priorities_text: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Render the segment-constant fields of the single-post pre-score prompt."""
+
+    if priorities_text is None:
+        priorities_text = _format_priorities(segment_config)
+    return {
         "segment_name": segment_name,
         "audience": segment_config.get("audience", ""),
-        "priorities": "\n".join(
-            f"• {priority}" for priority in segment_config.get("priorities", [])
-        )
-        or "(no explicit priorities provided)",
-        "post_id": stripped_post.get("id", ""),
-        "post_title": stripped_post.get("title", ""),
-        "post_snippet": stripped_post.get("content", ""),
-        "subreddit": stripped_post.get("subreddit", ""),
+        "priorities": priorities_text or "(no explicit priorities provided)",
     }
 
-    request_payload = {
-        "template_name": "voc_reddit_prescore_prompt.txt",
-        "context": context,
-        "model": gemini_client.default_model,
-        "temperature": 0.0,
-        "max_output_tokens": 2048,
-        "response_schema": deepcopy(PRESCORE_RESPONSE_SCHEMA),
+
+def _prescore_context(
+    stripped_post: StrippedPost,
+    segment_name: str,
+    segment_config: Dict[str, Any],
+    priorities_text: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build the ``voc_reddit_prescore_prompt.txt`` context for a stripped post."""
+
+    return {
+        **_prescore_segment_context(segment_name, segment_config, priorities_text),
+        "post_id": stripped_post["id"],
+        "post_title": stripped_post["title"],
+        "post_snippet": stripped_post["content"],
+        "subreddit": stripped_post["subreddit"],
     }
-    logger.info(
-        "Gemini pre-score request",
-        extra={
-            "operation": "pre_score_post",
-            "segment_name": segment_name,
-            "post_id": stripped_post.get("id", ""),
-            "post_title": stripped_post.get("title", "")[:100],
-            "post_snippet": stripped_post.get("content", "")[:200],
-            "model": gemini_client.default_model,
-            "prompt_context": context,
-            "audience": segment_config.get("audience", ""),
-            "priorities": segment_config.get("priorities", []),
-        },
-    )
 
-    try:
-        response = gemini_client.generate_json_response(
-            template_name="voc_reddit_prescore_prompt.txt",
-            context=context,
-            model=gemini_client.default_model,
-            temperature=0.0,
-            max_output_tokens=2048,
-            response_schema=PRESCORE_RESPONSE_SCHEMA,
-        )
-        
-        # Log the actual prompt that was sent (load template and render it)
-        try:
-            prompt_template = gemini_client._load_prompt("voc_reddit_prescore_prompt.txt")
-            rendered_prompt = prompt_template.format(**context)
-            logger.info(
-                "Rendered prompt sent to Gemini",
-                extra={
-                    "operation": "pre_score_post",
-                    "segment_name": segment_name,
-                    "post_id": stripped_post.get("id", ""),
-                    "rendered_prompt": rendered_prompt[:1000],  # First 1000 chars
-                    "prompt_length": len(rendered_prompt),
-                },
-            )
-        except Exception as prompt_log_exc:
-            # Don't fail scoring if we can't log the prompt
-            logger.debug(f"Could not log rendered prompt: {prompt_log_exc}")
-            
-    except GeminiClientError:
-        raise
-    except Exception as exc:  # noqa: BLE001 - surface unexpected errors consistently
-        raise GeminiClientError(f"Gemini pre-score request failed: {exc}") from exc
 
-    logger.info(
-        "Gemini pre-score response received",
-        extra={
-            "operation": "pre_score_post",
-            "segment_name": segment_name,
-            "post_id": stripped_post.get("id", ""),
-            "raw_response": response.raw_text[:500],
-            "response_length": len(response.raw_text),
-            "full_raw_response": response.raw_text,  # Include full response for debugging
-            "expected_schema": PRESCORE_RESPONSE_SCHEMA,
-        },
+def _prescore_cache_key(
+    stripped_post: StrippedPost,
+    segment_context: Dict[str, Any],
+    template_name: str,
+    template: str,
+    model: str,
+) -> str:
+    return prescore_cache.prescore_cache_key(
+        segment_context,
+        template_name,
+        template,
+        stripped_post["title"],
+        stripped_post["content"],
+        model,
     )
 
-    try:
-        result = PreScoreResult(**response.data)
-        logger.info(
-            "Response parsed successfully",
+
+def _validate_prescore_response(
+    response: GeminiJsonResponse,
+    stripped_post: StrippedPost,
+    segment_name: str,
+    cache_key: str,
+) -> PreScoreResult:
+    """Validate a Gemini pre-score response and cache the result."""
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Gemini pre-score response received",
             extra={
                 "operation": "pre_score_post",
                 "segment_name": segment_name,
-                "post_id": stripped_post.get("id", ""),
-                "parsed_data": response.data,
+                "post_id": stripped_post["id"],
+                "raw_response": response.raw_text[:500],
+                "response_length": len(response.raw_text),
             },
         )
+
+    try:
+        result = PreScoreResult.model_validate(response.data)
     except ValidationError as exc:  # noqa: BLE001 - validation errors should bubble up
         logger.warning(
             "Pre-score validation failed",
             extra={
                 "operation": "pre_score_post",
                 "segment_name": segment_name,
-                "post_id": stripped_post.get("id", ""),
+                "post_id": stripped_post["id"],
                 "error": str(exc),
                 "raw_response": response.raw_text[:500],
-                "full_raw_response": response.raw_text,
                 "response_data": response.data,
-                "expected_schema": PRESCORE_RESPONSE_SCHEMA,
             },
         )
         raise GeminiClientError("Pre-score validation failed") from exc
@@ -202,7 +221,7 @@ def pre_score_post(
             extra={
                 "operation": "pre_score_post",
                 "segment_name": segment_name,
-                "post_id": stripped_post.get("id", ""),
+                "post_id": stripped_post["id"],
                 "error": str(exc),
                 "raw_response": response.raw_text[:500],
             },
@@ -217,12 +236,144 @@ def pre_score_post(
             "post_id": result.post_id,
             "score": result.score,
             "priority": result.priority,
-            "reason": result.reason[:200] if result.reason else "",
         },
     )
+    prescore_cache.cache.set(cache_key, result)
     return result
 
 
+def pre_score_post(
+    post: Dict[str, Any],
+    segment_name: str,
+    *,
+    gemini_client: GeminiClient,
+    segment_config: Optional[Dict[str, Any]] = None,
+    priorities_text: Optional[str] = None,
+    stripped_post: Optional[StrippedPost] = None,
+) -> PreScoreResult:
+    """Run Gemini pre-scoring for a single Reddit post.
+
+    ``priorities_text`` lets callers scoring many posts for one segment pass
+    the pre-rendered priority bullets instead of rebuilding them per post, and
+    ``stripped_post`` reuses a ``_strip_post_for_prescore`` result the caller
+    already has.
+    """
+
+    segment_config = segment_config or {}
+    if stripped_post is None:
+        stripped_post = _strip_post_for_prescore(post)
+
+    # Scoring is deterministic (temperature 0), so identical posts scored for
+    # the same segment priorities and model can reuse an earlier result.
+    model = gemini_client.default_model
+    cache_key = _prescore_cache_key(
+        stripped_post,
+        _prescore_segment_context(segment_name, segment_config, priorities_text),
+        _PRESCORE_TEMPLATE,
+        gemini_client._load_prompt(_PRESCORE_TEMPLATE),
+        model,
+    )
+    cached = prescore_cache.cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    context = _prescore_context(stripped_post, segment_name, segment_config, priorities_text)
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Gemini pre-score request",
+            extra={
+                "operation": "pre_score_post",
+                "segment_name": segment_name,
+                "post_id": stripped_post["id"],
+                "post_title": stripped_post["title"][:100],
+                "post_snippet": stripped_post["content"][:200],
+                "model": model,
+                "prompt_context": context,
+            },
+        )
+
+    try:
+        response = gemini_client.generate_json_response(
+            template_name=_PRESCORE_TEMPLATE,
+            context=context,
+            model=model,
+            temperature=0.0,
+            max_output_tokens=2048,
+            response_schema=PRESCORE_RESPONSE_SCHEMA,
+        )
+        
+        # Log the actual prompt that was sent; rendering it again is only
+        # worth the cost when debug logging is on.
+        if logger.isEnabledFor(logging.DEBUG):
+            try:
+                prompt_template = gemini_client._load_prompt(_PRESCORE_TEMPLATE)
+                rendered_prompt = prompt_template.format(**context)
+                logger.debug(
+                    "Rendered prompt sent to Gemini",
+                    extra={
+                        "operation": "pre_score_post",
+                        "segment_name": segment_name,
+                        "post_id": stripped_post["id"],
+                        "rendered_prompt": rendered_prompt[:1000],  # First 1000 chars
+                        "prompt_length": len(rendered_prompt),
+                    },
+                )
+            except Exception as prompt_log_exc:
+                # Don't fail scoring if we can't log the prompt
+                logger.debug(f"Could not log rendered prompt: {prompt_log_exc}")
+
+    except GeminiClientError:
+        raise
+    except Exception as exc:  # noqa: BLE001 - surface unexpected errors consistently
+        raise GeminiClientError(f"Gemini pre-score request failed: {exc}") from exc
+
+    return _validate_prescore_response(response, stripped_post, segment_name, cache_key)
+
+
+def _prescore_failure_warning(exc: BaseException, post_id: str, segment_name: str) -> str:
+    """Log a per-post pre-score failure and return the warning for the caller."""
+
+    if isinstance(exc, GeminiClientError):
+        warning = f"Pre-score failed for post '{post_id}' in segment '{segment_name}': {exc}"
+        logger.warning(
+            warning,
+            extra={
+                "operation": "pre_score",
+                "segment_name": segment_name,
+                "post_id": post_id,
+                "error_type": "GeminiClientError",
+                "error": str(exc),
+            },
+        )
+    else:
+        warning = (
+            f"Unexpected error during pre-score for post '{post_id}' in segment '{segment_name}': {exc}"
+        )
+        logger.error(
+            warning,
+            exc_info=exc,
+            extra={
+                "operation": "pre_score",
+                "segment_name": segment_name,
+                "post_id": post_id,
+                "error_type": type(exc).__name__,
+            },
+        )
+    return warning
+
+
+def _with_prescore(post: Dict[str, Any], result: PreScoreResult) -> Dict[str, Any]:
+    return {
+        **post,
+        "prescore": {
+            "relevance_score": result.score,
+            "priority": result.priority,
+            "quick_reason": result.reason or "",
+        },
+    }
+
+
 def pre_score_posts(
     posts: Sequence[Dict[str, Any]],
     segment_name: str,
@@ -231,7 +382,16 @@ def pre_score_posts(
     segment_config: Optional[Dict[str, Any]] = None,
     max_workers: int = 5,
 ) -> Tuple[List[Dict[str, Any]], List[str]]:
-    """Pre-score posts concurrently while collecting warnings."""
+    """Pre-score posts concurrently while collecting warnings.
+
+    Multiple posts are scored through :func:`batch_prescore_posts`-style
+    batched requests first; only posts a batch fails to score fall back to
+    one :func:`pre_score_post` request each. Warnings report posts that could
+    not be scored either way.
+
+    ``gemini_client`` is shared by every worker thread so all requests reuse
+    its pooled connections; do not create a client per post.
+    """
 
     segment_config = segment_config or {}
     warnings: List[str] = []
@@ -240,14 +400,52 @@ def pre_score_posts(
         return [], warnings
 
     start_time = time.perf_counter()
-    scored_posts: List[Dict[str, Any]] = []
-    
+    # Results land in their input slot, so completion order never matters.
+    results: List[Optional[Dict[str, Any]]] = [None] * len(posts)
+    scored_count = 0
+    priorities_text = _format_priorities(segment_config)
+    # Strip every post once; the batch path and the single-post fallback share it.
+    stripped_posts = [_strip_post_for_prescore(post) for post in posts]
+
+    # Several posts share one batched request; anything the batches miss
+    # (failed call, skipped or malformed line) is scored individually below.
+    if len(posts) >= 2:
+        batch_scored, _batch_warnings = _prescore_in_batches(
+            posts,
+            segment_config,
+            segment_name,
+            gemini_client,
+            _PRESCORE_BATCH_SIZE,
+            max_workers,
+            priorities_text,
+            stripped_posts,
+        )
+        for position, scored_post in batch_scored:
+            prescore = scored_post["prescore"]
+            score = prescore["relevance_score"]
+            if not isinstance(score, (int, float)):
+                continue  # rescored individually below
+            prescore["priority"] = score >= _PRIORITY_SCORE
+            results[position] = scored_post
+            scored_count += 1
+        if scored_count < len(posts):
+            logger.info(
+                "Falling back to single-post pre-score for unscored posts",
+                extra={
+                    "operation": "pre_score",
+                    "segment_name": segment_name,
+                    "fallback_count": len(posts) - scored_count,
+                },
+            )
+
+    pending = [(index, post) for index, post in enumerate(posts) if results[index] is None]
+
     logger.info(
         "Starting parallel pre-score",
         extra={
             "operation": "pre_score",
             "segment_name": segment_name,
-            "post_count": len(posts),
+            "post_count": len(pending),
             "max_workers": max_workers,
         },
     )
@@ -260,8 +458,10 @@ def pre_score_posts(
                 segment_name,
                 gemini_client=gemini_client,
                 segment_config=segment_config,
+                priorities_text=priorities_text,
+                stripped_post=stripped_posts[index],
             ): (index, post)
-            for index, post in enumerate(posts)
+            for index, post in pending
         }
 
         for future in as_completed(future_map):
@@ -270,72 +470,54 @@ def pre_score_posts(
 
             try:
                 prescore_result = future.result()
-            except GeminiClientError as exc:
-                warning = (
-                    f"Pre-score failed for post '{post_id}' in segment '{segment_name}': {exc}"
-                )
-                logger.warning(
-                    warning,
-                    extra={
-                        "operation": "pre_score",
-                        "segment_name": segment_name,
-                        "post_id": post_id,
-                        "error_type": "GeminiClientError",
-                        "error": str(exc),
-                    },
-                )
-                warnings.append(warning)
-                continue
             except Exception as exc:  # noqa: BLE001 - capture unexpected issues per post
-                warning = (
-                    f"Unexpected error during pre-score for post '{post_id}' in segment '{segment_name}': {exc}"
-                )
-                logger.exception(
-                    warning,
+                warnings.append(_prescore_failure_warning(exc, post_id, segment_name))
+                continue
+
+            results[index] = _with_prescore(original_post, prescore_result)
+            scored_count += 1
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Post scored",
                     extra={
                         "operation": "pre_score",
                         "segment_name": segment_name,
                         "post_id": post_id,
-                        "error_type": type(exc).__name__,
+                        "score": prescore_result.score,
+                        "priority": prescore_result.priority,
                     },
                 )
-                warnings.append(warning)
-                continue
-
-            enriched_post = original_post.copy()
-            enriched_post["prescore"] = {
-                "relevance_score": prescore_result.score,
-                "priority": prescore_result.priority,
-                "quick_reason": prescore_result.reason or "",
-            }
-            enriched_post["_prescore_index"] = index
-            scored_posts.append(enriched_post)
-            
-            # Log each successful score as it completes
-            logger.info(
-                "Post scored",
-                extra={
-                    "operation": "pre_score",
-                    "segment_name": segment_name,
-                    "post_id": post_id,
-                    "score": prescore_result.score,
-                    "priority": prescore_result.priority,
-                    "progress": f"{len(scored_posts)}/{len(posts)}",
-                },
-            )
+            if scored_count % _PROGRESS_LOG_INTERVAL == 0:
+                logger.info(
+                    "Pre-score progress %d/%d",
+                    scored_count,
+                    len(posts),
+                    extra={"operation": "pre_score", "segment_name": segment_name},
+                )
 
-    scored_posts.sort(key=lambda item: item.get("_prescore_index", 0))
-    for post in scored_posts:
-        post.pop("_prescore_index", None)
+    # Compact the results and track the score distribution in one pass
+    scored_posts: List[Dict[str, Any]] = []
+    low = high = total = 0
+    for post in results:
+        if post is None:
+            continue
+        score = post["prescore"]["relevance_score"]
+        if not scored_posts:
+            low = high = score
+        elif score < low:
+            low = score
+        elif score > high:
+            high = score
+        total += score
+        scored_posts.append(post)
 
     duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
     
-    # Calculate score distribution for visibility
-    scores = [p.get("prescore", {}).get("relevance_score", 0) for p in scored_posts]
     score_distribution = {
-        "min": min(scores) if scores else 0,
-        "max": max(scores) if scores else 0,
-        "avg": round(sum(scores) / len(scores), 2) if scores else 0,
+        "min": low,
+        "max": high,
+        "avg": round(total / len(scored_posts), 2) if scored_posts else 0,
     }
     
     logger.info(
@@ -354,242 +536,371 @@ def pre_score_posts(
     return scored_posts, warnings
 
 
-def batch_prescore_posts(
-    posts: Sequence[Dict[str, Any]],
+def _process_prescore_batch(
+    batch: Sequence[Dict[str, Any]],
+    batch_start: int,
     segment_config: Dict[str, Any],
     segment_name: str,
     gemini_client: GeminiClient,
-    batch_size: int = 25,
-) -> Tuple[List[Dict[str, Any]], List[str]]:
+    prompt_template: str,
+    base_context: Dict[str, Any],
+    stripped_batch: Sequence[StrippedPost],
+) -> Tuple[List[Tuple[int, Dict[str, Any]]], List[str]]:
     """
-    Stage 1: Batch pre-score posts using only title + snippet (no comments).
-    Fast, lightweight analysis to filter down to promising posts.
-    
-    Uses JSON array format for cleaner, more reliable Gemini parsing.
-    Falls back to text format if payload exceeds token limits.
+    Pre-score one batch of posts with a single Gemini call.
+
+    ``base_context`` holds the segment-constant prompt fields, built once per
+    run by ``_prescore_in_batches``. ``stripped_batch`` holds the
+    ``_strip_post_for_prescore`` output for ``batch``, position for position.
+
+    Posts with a cached pre-score are answered from ``prescore_cache`` and
+    posts with neither title nor content score 0 without asking Gemini; both
+    are left out of the Gemini call. Fresh numeric scores are cached in turn.
+
+    Returns ``(position, enriched_post)`` pairs, where ``position`` is the
+    post's offset in the full input, so callers can restore input order.
     """
     warnings: List[str] = []
-    
-    if not posts:
-        return [], warnings
-    
-    all_scored_posts = []
-    
-    # Keep full posts in memory for matching back after scoring
-    posts_by_id = {post.get("id"): post for post in posts if post.get("id")}
-    
-    # Process in batches to avoid token limits
-    for batch_start in range(0, len(posts), batch_size):
-        batch_end = min(batch_start + batch_size, len(posts))
-        batch = posts[batch_start:batch_end]
-        
-        # Strip posts to minimal data for pre-scoring
-        stripped_batch = [_strip_post_for_prescore(post) for post in batch]
-        
+    batch_end = batch_start + len(batch)
+    model = gemini_client.default_model
+
+    scored: List[Tuple[int, Dict[str, Any]]] = []
+    # (offset in batch, cache key) for each post that still needs Gemini
+    uncached: List[Tuple[int, str]] = []
+    for i, stripped_post in enumerate(stripped_batch):
+        if not (stripped_post["title"] or stripped_post["content"]):
+            prescore = {"relevance_score": 0, "quick_reason": "empty post"}
+        else:
+            cache_key = _prescore_cache_key(
+                stripped_post, base_context, _BATCH_PRESCORE_TEMPLATE, prompt_template, model
+            )
+            cached = prescore_cache.cache.get(cache_key)
+            if cached is None:
+                uncached.append((i, cache_key))
+                continue
+            prescore = {"relevance_score": cached.score, "quick_reason": cached.reason or ""}
+        scored.append((batch_start + i, {**batch[i], "prescore": prescore}))
+
+    if not uncached:
         logger.info(
-            "Starting batch pre-score (batch %d-%d)",
+            "Batch pre-score needed no Gemini call for posts %d-%d",
             batch_start,
             batch_end,
-            extra={
-                "operation": "batch_prescore",
-                "segment_name": segment_name,
-                "batch_start": batch_start,
-                "batch_end": batch_end,
-                "batch_size": len(batch),
-            },
+            extra={"operation": "batch_prescore", "segment_name": segment_name},
         )
-        
-        # Build JSONL-style text input (one post per line, not a JSON array)
-        # Each line contains post_index, title, and content for easy parsing
-        posts_text_lines = []
-        for i, post in enumerate(stripped_batch):
-            post_line = {
-                "post_index": i,
-                "title": post.get("title", "[N/A]"),
-                "content": post.get("content", "")
-            }
-            posts_text_lines.append(json.dumps(post_line, ensure_ascii=False))
-        
-        posts_summary = "\n".join(posts_text_lines)
-        
+        return scored, warnings
+
+    logger.info(
+        "Starting batch pre-score (batch %d-%d)",
+        batch_start,
+        batch_end,
+        extra={
+            "operation": "batch_prescore",
+            "segment_name": segment_name,
+            "batch_start": batch_start,
+            "batch_end": batch_end,
+            "batch_size": len(batch),
+            "skipped_count": len(scored),
+        },
+    )
+
+    # Build JSONL-style text input (one post per line, not a JSON array)
+    # Each line contains post_index, title, and content for easy parsing
+    posts_text_lines = []
+    for i, (offset, _) in enumerate(uncached):
+        post = stripped_batch[offset]
+        post_line = {
+            "post_index": i,
+            "title": post["title"],
+            "content": post["content"],
+        }
+        posts_text_lines.append(_dumps(post_line))
+
+    posts_summary = "\n".join(posts_text_lines)
+
+    logger.info(
+        "Using JSONL input format for Gemini (one post per line)",
+        extra={
+            "operation": "batch_prescore",
+            "segment_name": segment_name,
+            "batch_start": batch_start,
+            "post_count": len(posts_text_lines),
+        },
+    )
+
+    # The template puts everything that varies per batch (posts_json,
+    # batch_size) at the end, so every batch for a segment shares one prompt
+    # prefix that Gemini's implicit context caching can reuse.
+    prompt_context = {
+        **base_context,
+        "posts_json": posts_summary,
+        "batch_size": len(uncached),
+    }
+
+    logger.info(
+        "Sending to Gemini - full posts_summary: %s",
+        posts_summary[:500] + "..." if len(posts_summary) > 500 else posts_summary,
+        extra={
+            "operation": "batch_prescore",
+            "segment_name": segment_name,
+            "batch_start": batch_start,
+            "full_posts_summary_length": len(posts_summary),
+        },
+    )
+
+    try:
+        # Use generate_text instead of generate_json_response since we're getting JSONL back
+        # Gemini's JSON parser tries to parse the whole thing as one object, which fails with JSONL
+        # Temperature 0, like single-post scoring, since fresh scores are cached.
+        raw_text = gemini_client.generate_text(
+            prompt=prompt_template.format(**prompt_context),
+            temperature=0.0,
+            max_output_tokens=4096,
+            response_mime_type="text/plain",  # Get plain text, we'll parse JSONL ourselves
+        )
+
+        # Create a response-like object for consistency with existing code
+        class SimpleResponse:
+            def __init__(self, text):
+                self.raw_text = text
+
+        response = SimpleResponse(raw_text)
+
+        # Debug: Log what we got back from Gemini (truncated)
+        raw_text = response.raw_text if response and response.raw_text else "EMPTY"
         logger.info(
-            "Using JSONL input format for Gemini (one post per line)",
+            "Received from Gemini - full raw response: %s",
+            raw_text[:500] + "..." if len(raw_text) > 500 else raw_text,
             extra={
                 "operation": "batch_prescore",
                 "segment_name": segment_name,
                 "batch_start": batch_start,
-                "post_count": len(posts_text_lines),
+                "full_response_length": len(raw_text),
             },
         )
-        
-        prompt_context = {
-            "segment_name": segment_name,
-            "audience": segment_config.get("audience", ""),
-            "priorities_list": "\n".join([f"• {p}" for p in segment_config.get("priorities", [])]),
-            "posts_json": posts_summary,
-            "batch_size": len(batch),
-        }
-        
-        logger.info(
-            "Sending to Gemini - full posts_summary: %s",
-            posts_summary[:500] + "..." if len(posts_summary) > 500 else posts_summary,
+    except GeminiClientError as exc:
+        logger.error(
+            "Gemini API or parsing error: %s",
+            str(exc),
             extra={
                 "operation": "batch_prescore",
                 "segment_name": segment_name,
                 "batch_start": batch_start,
-                "full_posts_summary_length": len(posts_summary),
             },
         )
-        
+        warning = f"Batch pre-score failed for posts {batch_start}-{batch_end}: {exc}"
+        warnings.append(warning)
+        return scored, warnings
+
+    if not response or not response.raw_text:
+        warning = f"Batch pre-score returned empty response for posts {batch_start}-{batch_end}"
+        logger.warning(warning, extra={"operation": "batch_prescore", "segment_name": segment_name})
+        warnings.append(warning)
+        return scored, warnings
+
+    # Parse JSONL format: one JSON object per line
+    parsed_scores = []
+    line_count = 0
+    non_empty_lines = filter(None, (line.strip() for line in response.raw_text.splitlines()))
+
+    for line_num, line in enumerate(non_empty_lines, start=1):
+        line_count = line_num
         try:
-            # Use generate_text instead of generate_json_response since we're getting JSONL back
-            # Gemini's JSON parser tries to parse the whole thing as one object, which fails with JSONL
-            raw_text = gemini_client.generate_text(
-                prompt=gemini_client._load_prompt("voc_reddit_batch_prescore.txt").format(**prompt_context),
-                temperature=0.3,
-                max_output_tokens=4096,
-                response_mime_type="text/plain",  # Get plain text, we'll parse JSONL ourselves
-            )
-            
-            # Create a response-like object for consistency with existing code
-            class SimpleResponse:
-                def __init__(self, text):
-                    self.raw_text = text
-            
-            response = SimpleResponse(raw_text)
-            
-            # Debug: Log what we got back from Gemini (truncated)
-            raw_text = response.raw_text if response and response.raw_text else "EMPTY"
-            logger.info(
-                "Received from Gemini - full raw response: %s",
-                raw_text[:500] + "..." if len(raw_text) > 500 else raw_text,
+            score_obj = _loads(line)
+            if not isinstance(score_obj, dict):
+                raise ValueError(f"expected a JSON object, got {type(score_obj).__name__}")
+            parsed_scores.append(score_obj)
+            logger.debug(
+                "Successfully parsed JSONL line %d",
+                line_num,
                 extra={
                     "operation": "batch_prescore",
                     "segment_name": segment_name,
-                    "batch_start": batch_start,
-                    "full_response_length": len(raw_text),
+                    "line_num": line_num,
+                    "post_index": score_obj.get("post_index"),
                 },
             )
-        except GeminiClientError as exc:
-            logger.error(
-                "Gemini API or parsing error: %s",
-                str(exc),
+        except ValueError as exc:  # json/orjson.JSONDecodeError subclass it
+            # Log warning but continue processing other lines
+            warning = f"Failed to parse JSONL line {line_num} in batch {batch_start}-{batch_end}: {exc} | Line: {line[:100]}"
+            logger.warning(
+                warning,
                 extra={
                     "operation": "batch_prescore",
                     "segment_name": segment_name,
                     "batch_start": batch_start,
+                    "line_num": line_num,
                 },
             )
-            warning = f"Batch pre-score failed for posts {batch_start}-{batch_end}: {exc}"
-            warnings.append(warning)
-            continue
-        
-        if not response or not response.raw_text:
-            warning = f"Batch pre-score returned empty response for posts {batch_start}-{batch_end}"
-            logger.warning(warning, extra={"operation": "batch_prescore", "segment_name": segment_name})
             warnings.append(warning)
+            continue  # Skip this line and move to the next
+
+    if not parsed_scores:
+        warning = f"No valid JSONL lines parsed for batch {batch_start}-{batch_end}"
+        logger.warning(warning, extra={"operation": "batch_prescore", "segment_name": segment_name})
+        warnings.append(warning)
+        return scored, warnings
+
+    logger.info(
+        "Successfully parsed %d/%d JSONL lines",
+        len(parsed_scores),
+        line_count,
+        extra={
+            "operation": "batch_prescore",
+            "segment_name": segment_name,
+            "batch_start": batch_start,
+            "success_count": len(parsed_scores),
+            "total_lines": line_count,
+        },
+    )
+
+    # Merge scores back into ORIGINAL full posts (not stripped versions)
+    for score_obj in parsed_scores:
+        idx = score_obj.get("post_index")
+        if not isinstance(idx, int) or not 0 <= idx < len(uncached):
             continue
-        
-        # Parse JSONL format: one JSON object per line
-        parsed_scores = []
-        raw_lines = response.raw_text.strip().split('\n')
-        
-        logger.info(
-            "Parsing JSONL response: %d lines",
-            len(raw_lines),
-            extra={
-                "operation": "batch_prescore",
-                "segment_name": segment_name,
-                "batch_start": batch_start,
-                "line_count": len(raw_lines),
+
+        # post_index is the post's position among the uncached posts sent
+        offset, cache_key = uncached[idx]
+        score = score_obj.get("score", 0)
+        reason = score_obj.get("reason")
+        reason = "" if reason is None else str(reason)
+
+        # Add prescore to a copy of the original full post
+        enriched_post = {
+            **batch[offset],
+            "prescore": {
+                "relevance_score": score,  # Changed from relevance_score to score
+                "quick_reason": reason,    # Changed from quick_reason to reason
             },
-        )
-        
-        for line_num, line in enumerate(raw_lines, start=1):
-            line = line.strip()
-            if not line:
-                continue  # Skip empty lines
-            
+        }
+        scored.append((batch_start + offset, enriched_post))
+
+        if isinstance(score, (int, float)) and not isinstance(score, bool):
+            prescore_cache.cache.set(
+                cache_key,
+                PreScoreResult(
+                    post_id=stripped_batch[offset]["id"],
+                    score=score,
+                    priority=score >= _PRIORITY_SCORE,
+                    reason=reason or None,
+                ),
+            )
+
+    logger.info(
+        "Batch pre-score complete for posts %d-%d",
+        batch_start,
+        batch_end,
+        extra={
+            "operation": "batch_prescore",
+            "segment_name": segment_name,
+            "scored_count": len(parsed_scores),
+        },
+    )
+
+    return scored, warnings
+
+
+def _prescore_in_batches(
+    posts: Sequence[Dict[str, Any]],
+    segment_config: Dict[str, Any],
+    segment_name: str,
+    gemini_client: GeminiClient,
+    batch_size: int,
+    max_workers: int,
+    priorities_text: str,
+    stripped_posts: Sequence[StrippedPost],
+) -> Tuple[List[Tuple[int, Dict[str, Any]]], List[str]]:
+    """Score ``posts`` in concurrent batches, returning ``(position, post)`` pairs.
+
+    ``stripped_posts`` holds the ``_strip_post_for_prescore`` output for each post.
+    """
+
+    warnings: List[str] = []
+    scored_with_position: List[Tuple[int, Dict[str, Any]]] = []
+    prompt_template = gemini_client._load_prompt(_BATCH_PRESCORE_TEMPLATE)
+    base_context = {
+        "segment_name": segment_name,
+        "audience": segment_config.get("audience", ""),
+        "priorities_list": priorities_text,
+    }
+
+    # Process in batches to avoid token limits
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                _process_prescore_batch,
+                posts[batch_start:batch_start + batch_size],
+                batch_start,
+                segment_config,
+                segment_name,
+                gemini_client,
+                prompt_template,
+                base_context,
+                stripped_posts[batch_start:batch_start + batch_size],
+            ): batch_start
+            for batch_start in range(0, len(posts), batch_size)
+        }
+        for future in as_completed(futures):
+            batch_start = futures[future]
             try:
-                score_obj = json.loads(line)
-                parsed_scores.append(score_obj)
-                logger.debug(
-                    "Successfully parsed JSONL line %d",
-                    line_num,
-                    extra={
-                        "operation": "batch_prescore",
-                        "segment_name": segment_name,
-                        "line_num": line_num,
-                        "post_index": score_obj.get("post_index"),
-                    },
-                )
-            except json.JSONDecodeError as exc:
-                # Log warning but continue processing other lines
-                warning = f"Failed to parse JSONL line {line_num} in batch {batch_start}-{batch_end}: {exc} | Line: {line[:100]}"
-                logger.warning(
+                batch_scored, batch_warnings = future.result()
+            except Exception as exc:  # noqa: BLE001 - leave the batch to the per-post fallback
+                batch_end = min(batch_start + batch_size, len(posts))
+                warning = f"Batch pre-score failed for posts {batch_start}-{batch_end}: {exc}"
+                logger.exception(
                     warning,
                     extra={
                         "operation": "batch_prescore",
                         "segment_name": segment_name,
                         "batch_start": batch_start,
-                        "line_num": line_num,
                     },
                 )
                 warnings.append(warning)
-                continue  # Skip this line and move to the next
-        
-        if not parsed_scores:
-            warning = f"No valid JSONL lines parsed for batch {batch_start}-{batch_end}"
-            logger.warning(warning, extra={"operation": "batch_prescore", "segment_name": segment_name})
-            warnings.append(warning)
-            continue
-        
-        logger.info(
-            "Successfully parsed %d/%d JSONL lines",
-            len(parsed_scores),
-            len(raw_lines),
-            extra={
-                "operation": "batch_prescore",
-                "segment_name": segment_name,
-                "batch_start": batch_start,
-                "success_count": len(parsed_scores),
-                "total_lines": len(raw_lines),
-            },
-        )
-        
-        # Merge scores back into ORIGINAL full posts (not stripped versions)
-        for score_obj in parsed_scores:
-            idx = score_obj.get("post_index")
-            if idx is None or idx >= len(batch):
-                continue
-            
-            # Get the original post ID from the stripped batch
-            stripped_post = stripped_batch[idx]
-            post_id = stripped_post.get("id")
-            
-            # Retrieve the full original post from memory
-            original_post = posts_by_id.get(post_id)
-            if not original_post:
                 continue
-            
-            # Add prescore to the original full post
-            enriched_post = original_post.copy()
-            enriched_post["prescore"] = {
-                "relevance_score": score_obj.get("score", 0),  # Changed from relevance_score to score
-                "quick_reason": score_obj.get("reason", ""),   # Changed from quick_reason to reason
-            }
-            all_scored_posts.append(enriched_post)
-        
-        logger.info(
-            "Batch pre-score complete for posts %d-%d",
-            batch_start,
-            batch_end,
-            extra={
-                "operation": "batch_prescore",
-                "segment_name": segment_name,
-                "scored_count": len(parsed_scores),
-            },
-        )
+            scored_with_position.extend(batch_scored)
+            warnings.extend(batch_warnings)
+
+    return scored_with_position, warnings
+
+
+def batch_prescore_posts(
+    posts: Sequence[Dict[str, Any]],
+    segment_config: Dict[str, Any],
+    segment_name: str,
+    gemini_client: GeminiClient,
+    batch_size: int = 25,
+    max_workers: int = 5,
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Stage 1: Batch pre-score posts using only title + snippet (no comments).
+    Fast, lightweight analysis to filter down to promising posts.
+    
+    Each batch is sent as JSONL (one post per line) and scored back as JSONL.
+    Batch size alone bounds the prompt: titles and snippets are truncated by
+    ``_strip_post_for_prescore``, so no token estimate is needed.
+
+    Batches are sent concurrently (up to ``max_workers`` at a time) and the
+    scored posts are returned in input order.
+    """
+    warnings: List[str] = []
+    
+    if not posts:
+        return [], warnings
+    
+    scored_with_position, warnings = _prescore_in_batches(
+        posts,
+        segment_config,
+        segment_name,
+        gemini_client,
+        batch_size,
+        max_workers,
+        _format_priorities(segment_config),
+        [_strip_post_for_prescore(post) for post in posts],
+    )
+
+    scored_with_position.sort(key=lambda item: item[0])
+    all_scored_posts = [post for _, post in scored_with_position]
     
     logger.info(
         "All batches complete",
@@ -608,31 +919,35 @@ def filter_high_value_posts(posts: Sequence[Dict[str, Any]], min_score: float =
     accepted: List[Dict[str, Any]] = []
     rejected: List[Dict[str, Any]] = []
 
-    logger.debug(
-        "Filtering high value posts",
-        extra={
-            "operation": "reddit_filter",
-            "count": len(posts),
-            "min_score": min_score,
-        },
-    )
-    for post in posts:
-        analysis = post.get("ai_analysis") or {}
-        score = analysis.get("relevance_score")
-        if isinstance(score, (int, float)) and score >= min_score:
-            accepted.append(post)
-        else:
-            rejected.append(post)
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
         logger.debug(
-            "Post %s evaluated",
+            "Filtering high value posts",
             extra={
                 "operation": "reddit_filter",
-                "post_id": post.get("id"),
-                "score": score,
+                "count": len(posts),
                 "min_score": min_score,
-                "accepted": post in accepted,
             },
         )
+    for post in posts:
+        score = (post.get("ai_analysis") or {}).get("relevance_score")
+        try:
+            is_accepted = score is not None and score >= min_score
+        except TypeError:  # non-numeric score from the model
+            is_accepted = False
+        (accepted if is_accepted else rejected).append(post)
+        if debug_enabled:
+            logger.debug(
+                "Post %s evaluated",
+                post.get("id"),
+                extra={
+                    "operation": "reddit_filter",
+                    "post_id": post.get("id"),
+                    "score": score,
+                    "min_score": min_score,
+                    "accepted": is_accepted,
+                },
+            )
     logger.info(
         "High value post filtering complete",
         extra={
@@ -644,6 +959,34 @@ def filter_high_value_posts(posts: Sequence[Dict[str, Any]], min_score: float =
     return accepted, rejected
 
 
+def _format_pain_point(post: Dict[str, Any]) -> Optional[str]:
+    """Render one analysed post as a pain-point bullet for query generation."""
+
+    analysis = post.get("ai_analysis") or {}
+    if not isinstance(analysis, dict):
+        return None
+    pain_point = analysis.get("identified_pain_point") or "(pain point unavailable)"
+    relevance = analysis.get("relevance_score")
+    relevance_text = f" (relevance {relevance})" if relevance is not None else ""
+    return f"- {pain_point}{relevance_text} — r/{post.get('subreddit', '')} | {post.get('title', '')}"
+
+
+def _format_trend(trend: Dict[str, Any]) -> Optional[str]:
+    """Render one Google Trends entry as a bullet, or ``None`` without a query."""
+
+    query = trend.get("query")
+    if not query:
+        return None
+    related = trend.get("related_queries", {})
+    rising = (related.get("rising") or [])[:3] if isinstance(related, dict) else []
+    rising_terms = ", ".join(
+        str(item.get("query")) for item in rising if isinstance(item, dict) and item.get("query")
+    )
+    if rising_terms:
+        return f"- {query}: rising searches include {rising_terms}"
+    return f"- {query}: steady interest over time"
+
+
 def generate_curated_queries(
     analyzed_posts: Sequence[Dict[str, Any]],
     trends_data: Sequence[Dict[str, Any]],
@@ -662,23 +1005,10 @@ def generate_curated_queries(
         }
     )
     
-    # Build pain point lines
-    pain_point_lines: List[str] = []
-    for idx, post in enumerate(analyzed_posts):
-        ai_analysis = post.get("ai_analysis") or {}
-        if not isinstance(ai_analysis, dict):
-            logger.debug(f"Post {idx}: No valid ai_analysis, skipping")
-            continue
-        pain_point = ai_analysis.get("identified_pain_point") or "(pain point unavailable)"
-        relevance = ai_analysis.get("relevance_score")
-        title = post.get("title", "")
-        subreddit = post.get("subreddit", "")
-        if relevance is not None:
-            pain_point_lines.append(
-                f"- {pain_point} (relevance {relevance}) — r/{subreddit} | {title}"
-            )
-        else:
-            pain_point_lines.append(f"- {pain_point} — r/{subreddit} | {title}")
+    # Build pain point lines (posts whose ai_analysis is not a dict are skipped)
+    pain_point_lines: List[str] = [
+        line for line in map(_format_pain_point, analyzed_posts) if line is not None
+    ]
 
     logger.info(
         "Extracted pain points from posts",
@@ -690,22 +1020,9 @@ def generate_curated_queries(
     )
 
     # Build trends lines
-    trends_lines: List[str] = []
-    for trend in trends_data:
-        query = trend.get("query")
-        if not query:
-            continue
-        related = trend.get("related_queries", {})
-        rising = related.get("rising") if isinstance(related, dict) else []
-        rising_terms = ", ".join(
-            str(item.get("query"))
-            for item in rising[:3]
-            if isinstance(item, dict) and item.get("query")
-        )
-        if rising_terms:
-            trends_lines.append(f"- {query}: rising searches include {rising_terms}")
-        else:
-            trends_lines.append(f"- {query}: steady interest over time")
+    trends_lines: List[str] = [
+        line for line in map(_format_trend, trends_data) if line is not None
+    ]
 
     logger.info(
         "Extracted trend summaries",
@@ -2,14 +2,159 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import os
+import sqlite3
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from pytrends.request import TrendReq
-
 logger = logging.getLogger(__name__)
 
+_ISO_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+_pytrends_tls = threading.local()
+
+# Trends data moves slowly, so a fetched payload is reused for this long.
+_TRENDS_CACHE_TTL_SECONDS = 6 * 3600
+_TRENDS_CACHE_MAXSIZE = 512
+
+
+class _TrendsCache:
+    """Thread-safe, expiring LRU of per-payload Trends results.
+
+    Entries are kept in memory and, when ``TRENDS_CACHE_PATH`` is set, in a
+    SQLite file so repeated local or scheduled runs skip Google entirely.
+    Values are stored as JSON text so callers always get fresh objects.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        *,
+        maxsize: int = _TRENDS_CACHE_MAXSIZE,
+        ttl: float = _TRENDS_CACHE_TTL_SECONDS,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if path:
+            try:
+                self._db = sqlite3.connect(path, check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS trends "
+                    "(key TEXT PRIMARY KEY, payload TEXT NOT NULL, expires_at REAL NOT NULL)"
+                )
+                self._db.commit()
+            except sqlite3.Error as exc:
+                logger.warning(
+                    "Trends cache file unavailable; using memory only",
+                    extra={"operation": "trends_cache", "path": path, "error": str(exc)},
+                )
+                self._db = None
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= now:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+            elif self._db is not None:
+                try:
+                    row = self._db.execute(
+                        "SELECT expires_at, payload FROM trends WHERE key = ? AND expires_at > ?",
+                        (key, now),
+                    ).fetchone()
+                except sqlite3.Error as exc:
+                    self._log_db_error("get", exc)
+                    row = None
+                if row is not None:
+                    entry = (row[0], row[1])
+                    self._store(key, entry)
+        return json.loads(entry[1]) if entry is not None else None
+
+    def set(self, key: str, value: Any) -> None:
+        expires_at = time.time() + self.ttl
+        payload = json.dumps(value)
+        with self._lock:
+            self._store(key, (expires_at, payload))
+            if self._db is None:
+                return
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO trends (key, payload, expires_at) VALUES (?, ?, ?)",
+                    (key, payload, expires_at),
+                )
+                self._db.commit()
+            except sqlite3.Error as exc:
+                self._log_db_error("set", exc)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _log_db_error(action: str, exc: sqlite3.Error) -> None:
+        logger.warning(
+            "Trends cache file %s failed; using memory only",
+            action,
+            extra={"operation": "trends_cache", "error": str(exc)},
+        )
+
+    def _store(self, key: str, entry: Tuple[float, str]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+_trends_cache = _TrendsCache(os.environ.get("TRENDS_CACHE_PATH"))
+
+
+def _trends_cache_key(
+    query_terms: Sequence[str],
+    comparison_keyword: Optional[str],
+    timeframe: str,
+    geo: str,
+) -> str:
+    payload = json.dumps(
+        {
+            "terms": list(query_terms),
+            "comparison": comparison_keyword,
+            "timeframe": timeframe,
+            "geo": geo,
+        },
+        ensure_ascii=False,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _get_pytrends() -> Any:
+    """Return this thread's shared ``TrendReq`` session.
+
+    Creating a ``TrendReq`` fetches Google cookies, so the session is reused
+    across calls; it is kept per thread because ``TrendReq`` holds per-query
+    state between ``build_payload`` and the fetch methods.
+    """
+    instance = getattr(_pytrends_tls, "instance", None)
+    if instance is None:
+        # Imported lazily so trends-free code paths don't pay for pytrends/pandas.
+        from pytrends.request import TrendReq
+
+        instance = TrendReq(hl="en-US", tz=360)
+        _pytrends_tls.instance = instance
+    return instance
+
 
 def _dataframe_to_records(dataframe: Any, *, rename_columns: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
     if dataframe is None or getattr(dataframe, "empty", True):
@@ -19,20 +164,26 @@ def _dataframe_to_records(dataframe: Any, *, rename_columns: Optional[Dict[str,
     working_df = dataframe
     if rename_columns:
         working_df = working_df.rename(columns=rename_columns)
+    working_df = working_df.reset_index()
+
+    # Serialise datetime columns in one vectorised pass instead of per cell.
+    # NaT becomes NaN here and is filled below like any other missing value.
+    for column in working_df.select_dtypes(include=["datetime"]).columns:
+        working_df[column] = working_df[column].dt.strftime(_ISO_DATETIME_FORMAT)
+    for column in working_df.select_dtypes(include=["datetimetz"]).columns:
+        working_df[column] = working_df[column].map(lambda value: value.isoformat(), na_action="ignore")
 
     # Fix pandas FutureWarning
     working_df = working_df.infer_objects(copy=False).fillna(False)
 
-    records: List[Dict[str, Any]] = []
-    for record in working_df.reset_index().to_dict(orient="records"):
-        serialised: Dict[str, Any] = {}
-        for key, value in record.items():
-            if hasattr(value, "isoformat"):
-                serialised[key] = value.isoformat()
-            else:
-                serialised[key] = value
-        records.append(serialised)
-    
+    # Build rows from whole-column lists: tolist() converts each column to
+    # native Python values in one call, where to_dict(orient="records") boxes
+    # cell by cell.
+    columns = list(working_df.columns)
+    records: List[Dict[str, Any]] = [
+        dict(zip(columns, row))
+        for row in zip(*(working_df.iloc[:, position].tolist() for position in range(len(columns))))
+    ]
     logger.debug(f"Converted DataFrame to {len(records)} records")
     return records
 
@@ -53,6 +204,239 @@ def _extract_related_topics(related_topics: Dict[str, Any], keyword: str) -> Dic
     }
 
 
+# Google Trends accepts at most five terms per payload.
+_MAX_TRENDS_TERMS = 5
+# Payloads fetched at once; Google rate-limits Trends aggressively.
+_MAX_TRENDS_WORKERS = 3
+
+# Long-lived so its worker threads, and the TrendReq session each keeps in
+# _pytrends_tls, survive across fetch_google_trends calls. Sharing it also
+# caps concurrent payloads across overlapping calls.
+_trends_executor = ThreadPoolExecutor(
+    max_workers=_MAX_TRENDS_WORKERS, thread_name_prefix="google-trends"
+)
+
+
+def _keyword_chunks(keywords: Sequence[str], comparison_keyword: Optional[str]) -> List[List[str]]:
+    # Leave room for the comparison keyword in every payload.
+    size = _MAX_TRENDS_TERMS - 1 if comparison_keyword else _MAX_TRENDS_TERMS
+    keywords = list(keywords)
+    return [keywords[start:start + size] for start in range(0, len(keywords), size)]
+
+
+def _rescale_interest(frame: Any, terms: Sequence[Optional[str]]) -> Any:
+    """Rescale the ``terms`` columns so their joint peak is 100, as Trends reports it.
+
+    Values are rounded back to whole numbers, so a keyword that was dwarfed by
+    busier terms in its payload comes back coarser than a payload of its own.
+    """
+    columns = [term for term in terms if term and term in frame.columns]
+    peak = frame[columns].to_numpy().max() if columns else 0
+    if not peak or peak == 100:
+        return frame
+    rescaled = frame.copy()
+    rescaled[columns] = (frame[columns] * (100 / peak)).round().astype(int)
+    return rescaled
+
+
+def _build_keyword_trend(
+    keyword: str,
+    chunk: Sequence[str],
+    *,
+    comparison_keyword: Optional[str],
+    interest_over_time: Any,
+    related_queries: Dict[str, Any],
+    related_topics: Dict[str, Any],
+    duration_ms: float,
+) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Split one keyword's slice out of a batched Trends response.
+
+    Google scales every term in a payload against the payload's overall peak,
+    so the keyword's slice is rescaled to what a payload of just the keyword
+    and the comparison keyword would have returned.
+    """
+    other_keywords = [
+        kw for kw in chunk
+        if kw != keyword and (not comparison_keyword or kw.lower() != comparison_keyword.lower())
+    ]
+    keyword_interest = interest_over_time
+    if interest_over_time is not None and not interest_over_time.empty:
+        if other_keywords:
+            keyword_interest = interest_over_time.drop(columns=other_keywords, errors="ignore")
+        keyword_interest = _rescale_interest(keyword_interest, [keyword, comparison_keyword])
+
+    interest_records = _dataframe_to_records(
+        keyword_interest,
+        rename_columns={keyword: "primary_interest"},
+    )
+    related_queries_data = _extract_related_queries(related_queries, keyword)
+    related_topics_data = _extract_related_topics(related_topics, keyword)
+
+    # Check if we got meaningful data
+    has_interest_data = len(interest_records) > 0
+    has_related_queries = len(related_queries_data.get("top", [])) > 0 or len(related_queries_data.get("rising", [])) > 0
+    has_related_topics = len(related_topics_data.get("top", [])) > 0 or len(related_topics_data.get("rising", [])) > 0
+
+    logger.info(
+        f"Successfully fetched trends for '{keyword}'",
+        extra={
+            "keyword": keyword,
+            "duration_ms": duration_ms,
+            "interest_data_points": len(interest_records),
+            "related_queries_top": len(related_queries_data.get("top", [])),
+            "related_queries_rising": len(related_queries_data.get("rising", [])),
+            "related_topics_top": len(related_topics_data.get("top", [])),
+            "related_topics_rising": len(related_topics_data.get("rising", [])),
+            "has_interest_data": has_interest_data,
+            "has_related_queries": has_related_queries,
+            "has_related_topics": has_related_topics,
+        }
+    )
+
+    warning: Optional[str] = None
+    # Warn if we got no data at all
+    if not has_interest_data and not has_related_queries and not has_related_topics:
+        warning = f"Google Trends returned no data for '{keyword}' - possible rate limit or no search volume"
+        logger.warning(warning, extra={"keyword": keyword})
+
+    trend_data = {
+        "query": keyword,
+        "comparison_keyword": comparison_keyword,
+        "interest_over_time": interest_records,
+        "related_queries": related_queries_data,
+        "related_topics": related_topics_data,
+    }
+    return trend_data, warning
+
+
+def _fetch_chunk(
+    chunk: Sequence[str],
+    chunk_idx: int,
+    chunk_count: int,
+    *,
+    comparison_keyword: Optional[str],
+    timeframe: str,
+    geo: str,
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """Fetch one keyword payload (with retries) and split it per keyword.
+
+    Successful results are cached per payload; interest values are scaled
+    across every term in a payload, so they are only reused for the same terms.
+    Payloads where any keyword came back empty (often a rate limit) are not
+    cached, so the next run asks Google again.
+    """
+    curated_trends: List[Dict[str, Any]] = []
+    warnings: List[str] = []
+
+    chunk_start_time = time.perf_counter()
+
+    logger.info(
+        f"Processing keyword batch {chunk_idx}/{chunk_count}: {chunk}",
+        extra={"keywords": chunk, "index": chunk_idx}
+    )
+
+    query_terms = list(chunk)
+    if comparison_keyword and comparison_keyword.lower() not in {kw.lower() for kw in chunk}:
+        query_terms.append(comparison_keyword)
+
+    cache_key = _trends_cache_key(query_terms, comparison_keyword, timeframe, geo)
+    cached = _trends_cache.get(cache_key)
+    if cached is not None:
+        logger.info(
+            f"Using cached trends for {chunk}",
+            extra={"keywords": chunk, "index": chunk_idx},
+        )
+        return cached["trends"], cached["warnings"]
+
+    pytrends = _get_pytrends()
+
+    # Retry logic with exponential backoff
+    max_retries = 3
+    retry_delay = 2  # Start with 2 seconds
+
+    for attempt in range(max_retries):
+        try:
+            if attempt > 0:
+                logger.info(
+                    f"Retry attempt {attempt + 1}/{max_retries} for {chunk}",
+                    extra={"keywords": chunk, "attempt": attempt + 1, "delay_seconds": retry_delay}
+                )
+                time.sleep(retry_delay)
+                retry_delay *= 2  # Exponential backoff
+
+            logger.debug(f"Building payload for: {query_terms}")
+            pytrends.build_payload(query_terms, timeframe=timeframe, geo=geo)
+
+            logger.debug(f"Fetching interest over time for {chunk}")
+            interest_over_time = pytrends.interest_over_time()
+
+            logger.debug(f"Fetching related queries for {chunk}")
+            related_queries = pytrends.related_queries()
+
+            logger.debug(f"Fetching related topics for {chunk}")
+            related_topics = pytrends.related_topics()
+
+            chunk_duration = round((time.perf_counter() - chunk_start_time) * 1000, 2)
+            # Collect per attempt so a failure partway through cannot leave
+            # duplicates behind for the retry.
+            attempt_trends: List[Dict[str, Any]] = []
+            attempt_warnings: List[str] = []
+            for keyword in chunk:
+                trend_data, warning = _build_keyword_trend(
+                    keyword,
+                    chunk,
+                    comparison_keyword=comparison_keyword,
+                    interest_over_time=interest_over_time,
+                    related_queries=related_queries,
+                    related_topics=related_topics,
+                    duration_ms=chunk_duration,
+                )
+                if warning:
+                    attempt_warnings.append(warning)
+                attempt_trends.append(trend_data)
+
+            curated_trends, warnings = attempt_trends, attempt_warnings
+            if not warnings:
+                _trends_cache.set(cache_key, {"trends": curated_trends, "warnings": warnings})
+            # Successfully processed, break retry loop
+            break
+
+        except Exception as exc:
+            chunk_duration = round((time.perf_counter() - chunk_start_time) * 1000, 2)
+
+            if attempt < max_retries - 1:
+                logger.warning(
+                    f"Google Trends lookup failed for {chunk}, will retry",
+                    extra={
+                        "keywords": chunk,
+                        "attempt": attempt + 1,
+                        "max_retries": max_retries,
+                        "error": str(exc),
+                        "error_type": type(exc).__name__,
+                        "duration_ms": chunk_duration,
+                    }
+                )
+            else:
+                # Final attempt failed
+                logger.error(
+                    f"Google Trends lookup failed for {chunk} after {max_retries} attempts: {exc}",
+                    extra={
+                        "keywords": chunk,
+                        "attempts": max_retries,
+                        "error": str(exc),
+                        "error_type": type(exc).__name__,
+                        "duration_ms": chunk_duration,
+                    },
+                    exc_info=True,
+                )
+                warnings.extend(
+                    f"Google Trends lookup failed for '{keyword}' after {max_retries} attempts: {exc}"
+                    for keyword in chunk
+                )
+
+    return curated_trends, warnings
+
+
 def fetch_google_trends(segment_config: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], List[str]]:
     trends_config = segment_config.get("google_trends", {})
     primary_keywords: Sequence[str] = trends_config.get("primary_keywords") or segment_config.get("search_keywords", [])
@@ -75,130 +459,26 @@ def fetch_google_trends(segment_config: Dict[str, Any]) -> Tuple[List[Dict[str,
         logger.warning("No Google Trends keywords configured")
         return [], ["No Google Trends keywords configured for this segment."]
 
-    pytrends = TrendReq(hl="en-US", tz=360)
+    chunks = _keyword_chunks(primary_keywords, comparison_keyword)
     curated_trends: List[Dict[str, Any]] = []
     warnings: List[str] = []
 
-    for idx, keyword in enumerate(primary_keywords, 1):
-        keyword_start_time = time.perf_counter()
-        
-        logger.info(
-            f"Processing keyword {idx}/{len(primary_keywords)}: '{keyword}'",
-            extra={"keyword": keyword, "index": idx}
-        )
-        
-        query_terms = [keyword]
-        if comparison_keyword and comparison_keyword.lower() != keyword.lower():
-            query_terms.append(comparison_keyword)
-
-        # Retry logic with exponential backoff
-        max_retries = 3
-        retry_delay = 2  # Start with 2 seconds
-        
-        for attempt in range(max_retries):
-            try:
-                if attempt > 0:
-                    logger.info(
-                        f"Retry attempt {attempt + 1}/{max_retries} for '{keyword}'",
-                        extra={"keyword": keyword, "attempt": attempt + 1, "delay_seconds": retry_delay}
-                    )
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
-                
-                logger.debug(f"Building payload for: {query_terms}")
-                pytrends.build_payload(query_terms, timeframe=timeframe, geo=geo)
-                
-                logger.debug(f"Fetching interest over time for '{keyword}'")
-                interest_over_time = pytrends.interest_over_time()
-                
-                logger.debug(f"Fetching related queries for '{keyword}'")
-                related_queries = pytrends.related_queries()
-                
-                logger.debug(f"Fetching related topics for '{keyword}'")
-                related_topics = pytrends.related_topics()
-                
-                # Validate that we got actual data
-                interest_records = _dataframe_to_records(
-                    interest_over_time,
-                    rename_columns={keyword: "primary_interest"},
-                )
-                
-                related_queries_data = _extract_related_queries(related_queries, keyword)
-                related_topics_data = _extract_related_topics(related_topics, keyword)
-                
-                # Check if we got meaningful data
-                has_interest_data = len(interest_records) > 0
-                has_related_queries = len(related_queries_data.get("top", [])) > 0 or len(related_queries_data.get("rising", [])) > 0
-                has_related_topics = len(related_topics_data.get("top", [])) > 0 or len(related_topics_data.get("rising", [])) > 0
-                
-                keyword_duration = round((time.perf_counter() - keyword_start_time) * 1000, 2)
-                
-                logger.info(
-                    f"Successfully fetched trends for '{keyword}'",
-                    extra={
-                        "keyword": keyword,
-                        "duration_ms": keyword_duration,
-                        "interest_data_points": len(interest_records),
-                        "related_queries_top": len(related_queries_data.get("top", [])),
-                        "related_queries_rising": len(related_queries_data.get("rising", [])),
-                        "related_topics_top": len(related_topics_data.get("top", [])),
-                        "related_topics_rising": len(related_topics_data.get("rising", [])),
-                        "has_interest_data": has_interest_data,
-                        "has_related_queries": has_related_queries,
-                        "has_related_topics": has_related_topics,
-                    }
-                )
-                
-                # Warn if we got no data at all
-                if not has_interest_data and not has_related_queries and not has_related_topics:
-                    warning = f"Google Trends returned no data for '{keyword}' - possible rate limit or no search volume"
-                    logger.warning(warning, extra={"keyword": keyword})
-                    warnings.append(warning)
-                
-                trend_data = {
-                    "query": keyword,
-                    "comparison_keyword": comparison_keyword,
-                    "interest_over_time": interest_records,
-                    "related_queries": related_queries_data,
-                    "related_topics": related_topics_data,
-                }
-                
-                curated_trends.append(trend_data)
-                
-                # Successfully processed, break retry loop
-                break
-                
-            except Exception as exc:
-                keyword_duration = round((time.perf_counter() - keyword_start_time) * 1000, 2)
-                
-                if attempt < max_retries - 1:
-                    logger.warning(
-                        f"Google Trends lookup failed for '{keyword}', will retry",
-                        extra={
-                            "keyword": keyword,
-                            "attempt": attempt + 1,
-                            "max_retries": max_retries,
-                            "error": str(exc),
-                            "error_type": type(exc).__name__,
-                            "duration_ms": keyword_duration,
-                        }
-                    )
-                else:
-                    # Final attempt failed
-                    warning = f"Google Trends lookup failed for '{keyword}' after {max_retries} attempts: {exc}"
-                    logger.error(
-                        warning,
-                        extra={
-                            "keyword": keyword,
-                            "attempts": max_retries,
-                            "error": str(exc),
-                            "error_type": type(exc).__name__,
-                            "duration_ms": keyword_duration,
-                        },
-                        exc_info=True,
-                    )
-                    warnings.append(warning)
-    
+    # Chunks are independent payloads, so a few run at once on the shared
+    # executor; each worker thread reuses its own TrendReq session from
+    # _get_pytrends. map() keeps the results in keyword order.
+    fetch_chunk = partial(
+        _fetch_chunk,
+        chunk_count=len(chunks),
+        comparison_keyword=comparison_keyword,
+        timeframe=timeframe,
+        geo=geo,
+    )
+    for chunk_trends, chunk_warnings in _trends_executor.map(
+        fetch_chunk, chunks, range(1, len(chunks) + 1)
+    ):
+        curated_trends.extend(chunk_trends)
+        warnings.extend(chunk_warnings)
+
     # Final validation
     total_trends = len(curated_trends)
     logger.info(
@@ -0,0 +1,68 @@
+import pathlib
+import sys
+from types import SimpleNamespace
+from typing import Any, Iterator, List
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+BACKEND_ROOT = PROJECT_ROOT / "backend"
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from core import gemini_client
+from core.gemini_client import GeminiClient
+
+
+def test_tracker_ignores_braces_inside_strings() -> None:
+    tracker = gemini_client._JsonCompletionTracker()
+
+    assert tracker.feed('{"title": "a } b \\" {", ') is False
+    assert tracker.feed('"items": [1, {"x": 2}]') is False
+    assert tracker.feed("}\n```") is True
+    assert tracker.end is not None
+
+
+def test_tracker_handles_top_level_arrays() -> None:
+    tracker = gemini_client._JsonCompletionTracker()
+
+    assert tracker.feed("```json\n[") is False
+    assert tracker.feed("1, 2]") is True
+
+
+class _FakeModels:
+    def __init__(self, chunks: List[str]) -> None:
+        self.chunks = chunks
+        self.yielded = 0
+
+    def generate_content_stream(self, **_kwargs: Any) -> Iterator[Any]:
+        for text in self.chunks:
+            self.yielded += 1
+            yield SimpleNamespace(text=text)
+
+
+def test_generate_json_response_stops_after_top_level_value(tmp_path: pathlib.Path) -> None:
+    (tmp_path / "prompt.txt").write_text("Analyse {title}", encoding="utf-8")
+    models = _FakeModels(['{"score": ', '7, "tags": ["a"]}', "\n\nextra", "ignored"])
+    client = GeminiClient(api_key="key", prompt_dir=tmp_path)
+    client._client = SimpleNamespace(models=models)  # type: ignore[assignment]
+
+    response = client.generate_json_response("prompt.txt", {"title": "Post"})
+
+    assert response.data == {"score": 7, "tags": ["a"]}
+    assert response.raw_text == '{"score": 7, "tags": ["a"]}'
+    assert models.yielded == 2
+
+
+def test_parse_json_response_recovers_fenced_payloads() -> None:
+    assert GeminiClient.parse_json_response('{"a": 1}') == {"a": 1}
+    assert GeminiClient.parse_json_response('```json\n{"a": 1}\n```') == {"a": 1}
+    assert GeminiClient.parse_json_response('Sure: [1, 2]') == [1, 2]
+
+
+def test_clients_with_same_key_share_the_sdk_connection_pool() -> None:
+    first = GeminiClient(api_key="shared-key")
+    second = GeminiClient(api_key="shared-key")
+
+    assert first._get_client() is second._get_client()
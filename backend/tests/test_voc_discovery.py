@@ -0,0 +1,30 @@
+import pathlib
+import sys
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+BACKEND_ROOT = PROJECT_ROOT / "backend"
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from intelligence.voc_discovery import _merge_config
+
+
+def test_merge_config_overlays_nested_dicts_without_mutating_base() -> None:
+    base = {
+        "subreddits": ["a"],
+        "google_trends": {"timeframe": "today 3-m", "geo": "AU"},
+        "audience": "HR leaders",
+    }
+    override = {"subreddits": ["b"], "google_trends": {"geo": "US"}}
+
+    merged = _merge_config(base, override)
+
+    assert merged == {
+        "subreddits": ["b"],
+        "google_trends": {"timeframe": "today 3-m", "geo": "US"},
+        "audience": "HR leaders",
+    }
+    assert base["google_trends"] == {"timeframe": "today 3-m", "geo": "AU"}
@@ -0,0 +1,528 @@
+import os
+import pathlib
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+BACKEND_ROOT = PROJECT_ROOT / "backend"
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from intelligence import voc_reddit
+
+
+class FakeSnapshot:
+    def __init__(self, doc_id: str, exists: bool, data: Optional[Dict[str, Any]] = None):
+        self.id = doc_id
+        self.exists = exists
+        self.data = data
+
+    def to_dict(self) -> Optional[Dict[str, Any]]:
+        return self.data
+
+
+class FakeDocument:
+    def __init__(self, collection: "FakeCollection", doc_id: str):
+        self.collection = collection
+        self.id = doc_id
+
+
+class FakeCollection:
+    """Stands in for both the segment document and its legacy "posts" collection."""
+
+    def __init__(self, existing: List[str], aggregated: List[str]):
+        self.existing = set(existing)
+        self.aggregated = list(aggregated)
+        self.streamed = False
+        self.writes: List[Any] = []
+
+    def get(self) -> FakeSnapshot:
+        return FakeSnapshot("segment", bool(self.aggregated), {"processed_ids": self.aggregated})
+
+    def set(self, data: Dict[str, Any], merge: bool = False) -> None:
+        self.writes.append((data, merge))
+
+    def document(self, doc_id: str) -> FakeDocument:
+        return FakeDocument(self, doc_id)
+
+    def collection(self, _name: str) -> "FakeCollection":
+        return self
+
+    def select(self, field_paths: List[str]) -> "FakeCollection":
+        self.projection = list(field_paths)
+        return self
+
+    def order_by(self, field: str, direction: Any = None) -> "FakeCollection":
+        self.ordering = field
+        return self
+
+    def limit(self, count: int) -> "FakeCollection":
+        self.limit_count = count
+        return self
+
+    def stream(self) -> List[FakeSnapshot]:
+        self.streamed = True
+        return [FakeSnapshot(doc_id, True) for doc_id in sorted(self.existing)]
+
+
+class FakeFirestore:
+    def __init__(self, existing: List[str], aggregated: Optional[List[str]] = None):
+        self.posts = FakeCollection(existing, aggregated or [])
+        self.get_all_calls: List[List[str]] = []
+
+    def collection(self, _name: str) -> Any:
+        return self
+
+    def document(self, _segment_name: str) -> FakeCollection:
+        return self.posts
+
+    def get_all(self, refs: List[FakeDocument]) -> List[FakeSnapshot]:
+        ids = [ref.id for ref in refs]
+        self.get_all_calls.append(ids)
+        # Firestore does not guarantee ordering; reverse to prove we match by ID.
+        return [FakeSnapshot(doc_id, doc_id in self.posts.existing) for doc_id in reversed(ids)]
+
+
+def test_filter_unseen_only_reads_candidates() -> None:
+    client = FakeFirestore(existing=["old1", "old2", "old3"])
+    store = voc_reddit.RedditHistoryStore(client)
+
+    unseen = store.filter_unseen("Segment", ["old1", "new1", "", "new1", "new2"])
+
+    assert unseen == {"new1", "new2"}
+    assert client.get_all_calls == [["old1", "new1", "new2"]]
+    assert client.posts.streamed is False
+
+
+def test_filter_unseen_uses_cache_after_first_lookup() -> None:
+    client = FakeFirestore(existing=["old1"])
+    store = voc_reddit.RedditHistoryStore(client)
+
+    store.filter_unseen("Segment", ["old1", "new1"])
+    unseen = store.filter_unseen("Segment", ["old1", "new2"])
+
+    assert unseen == {"new2"}
+    assert client.get_all_calls[-1] == ["new2"]
+
+
+def test_filter_unseen_reads_aggregated_ids_before_legacy_docs() -> None:
+    client = FakeFirestore(existing=["legacy"], aggregated=["agg1", "agg2"])
+    store = voc_reddit.RedditHistoryStore(client)
+
+    unseen = store.filter_unseen("Segment", ["agg1", "legacy", "new"])
+
+    assert unseen == {"new"}
+    assert client.get_all_calls == [["legacy", "new"]]
+
+
+def test_mark_buffers_ids_into_one_aggregated_write() -> None:
+    client = FakeFirestore(existing=[])
+    store = voc_reddit.RedditHistoryStore(client)
+
+    store.mark("Segment", ["b", "a", ""])
+    store.flush()
+
+    [(data, merge)] = client.posts.writes
+    assert merge is True
+    assert sorted(data["processed_ids"].values) == ["a", "b"]
+
+
+def test_load_projects_legacy_history_to_ids() -> None:
+    client = FakeFirestore(existing=["legacy"], aggregated=["agg"])
+    store = voc_reddit.RedditHistoryStore(client)
+
+    assert store.load("Segment") == {"legacy", "agg"}
+    assert client.posts.projection == ["__name__"]
+    assert client.posts.ordering == "processed_at"
+
+
+def test_load_keeps_checking_legacy_docs_when_scan_hits_limit(monkeypatch: Any) -> None:
+    monkeypatch.setenv("FIRESTORE_HISTORY_LIMIT", "1")
+    client = FakeFirestore(existing=["legacy"])
+    store = voc_reddit.RedditHistoryStore(client)
+
+    store.load("Segment")
+    store.filter_unseen("Segment", ["older"])
+
+    assert client.posts.limit_count == 1
+    assert client.get_all_calls == [["older"]]
+
+
+def test_filter_unseen_without_client_uses_marked_ids() -> None:
+    store = voc_reddit.RedditHistoryStore(None)
+    store.mark("Segment", ["a"])
+
+    assert store.filter_unseen("Segment", ["a", "b"]) == {"b"}
+
+
+def test_fetch_posts_skips_processed_posts(monkeypatch: Any) -> None:
+    client = FakeFirestore(existing=["seen"])
+    store = voc_reddit.RedditHistoryStore(client)
+    collector = voc_reddit.RedditDataCollector(
+        api_key="key",
+        gemini_client=type("Gemini", (), {"default_model": "test-model"})(),
+        history_store=store,
+    )
+    payloads: Dict[str, List[Dict[str, Any]]] = {
+        "one": [
+            {"id": "seen", "title": "Seen", "score": 50, "num_comments": 5},
+            {"id": "fresh", "title": "Fresh", "score": 10, "num_comments": 5},
+        ],
+        "two": [{"id": "other", "title": "Other", "score": 30, "num_comments": 5}],
+    }
+    monkeypatch.setattr(
+        collector,
+        "_fetch_subreddit",
+        lambda subreddit, *, filters: payloads[subreddit],
+    )
+
+    curated, raw, warnings = collector.fetch_posts(
+        segment_name="Segment",
+        segment_config={"subreddits": ["one", "two"]},
+    )
+
+    assert [post["id"] for post in curated] == ["other", "fresh"]
+    assert len(raw) == 3
+    assert not warnings
+    assert len(client.get_all_calls) == 1
+
+
+def test_fetch_posts_coerces_string_scores(monkeypatch: Any) -> None:
+    collector = voc_reddit.RedditDataCollector(
+        api_key="key",
+        gemini_client=type("Gemini", (), {"default_model": "test-model"})(),
+        history_store=voc_reddit.RedditHistoryStore(None),
+    )
+    monkeypatch.setattr(
+        collector,
+        "_fetch_subreddit",
+        lambda subreddit, *, filters: [
+            {"id": "str", "title": "String", "score": "12", "num_comments": "3"},
+            {"id": "bad", "title": "Bad", "score": "n/a", "num_comments": None},
+        ],
+    )
+
+    curated, _raw, _warnings = collector.fetch_posts(
+        segment_name="Segment",
+        segment_config={"subreddits": ["one"]},
+    )
+
+    assert [(post["id"], post["score"], post["num_comments"]) for post in curated] == [
+        ("str", 12, 3),
+        ("bad", 0, 0),
+    ]
+
+
+def _comment(body: str, *replies: Dict[str, Any]) -> Dict[str, Any]:
+    return {"body": body, "replies": list(replies)}
+
+
+def test_extract_comment_bodies_collects_top_level_comments_first() -> None:
+    payload = {
+        "data": [
+            _comment("first", _comment("first reply", _comment("nested"))),
+            _comment("[deleted]"),
+            _comment("second"),
+        ],
+    }
+
+    bodies = voc_reddit.RedditDataCollector._extract_comment_bodies(payload, limit=3)
+
+    assert bodies == ["first", "second", "first reply"]
+
+
+def test_extract_comment_bodies_handles_deep_threads() -> None:
+    node: Dict[str, Any] = _comment("leaf")
+    for _ in range(5000):
+        node = _comment(" ", node)
+
+    assert voc_reddit.RedditDataCollector._extract_comment_bodies({"data": [node]}) == ["leaf"]
+
+
+def test_fetch_posts_scores_crossposts_once(monkeypatch: Any) -> None:
+    store = voc_reddit.RedditHistoryStore(None)
+    collector = voc_reddit.RedditDataCollector(
+        api_key="key",
+        gemini_client=type("Gemini", (), {"default_model": "test-model"})(),
+        history_store=store,
+    )
+    shared = {"id": "shared", "title": "Crosspost", "score": 10, "num_comments": 2}
+    monkeypatch.setattr(
+        collector,
+        "_fetch_subreddit",
+        lambda subreddit, *, filters: [dict(shared)],
+    )
+
+    curated, raw, _warnings = collector.fetch_posts(
+        segment_name="Segment",
+        segment_config={"subreddits": ["one", "two"]},
+    )
+
+    assert [(post["id"], post["subreddit"]) for post in curated] == [("shared", "one")]
+    assert [(post["id"], post["subreddit"]) for post in raw] == [("shared", "one")]
+
+
+def test_enrich_posts_preserves_order_and_collects_warnings(monkeypatch: Any) -> None:
+    collector = voc_reddit.RedditDataCollector(
+        api_key="key",
+        gemini_client=type("Gemini", (), {"default_model": "test-model"})(),
+        history_store=voc_reddit.RedditHistoryStore(None),
+    )
+
+    def fake_enrich_post(post: Dict[str, Any], **_kwargs: Any) -> Any:
+        if post["id"] == "1":
+            time.sleep(0.05)
+        return {**post, "enriched": True}, [f"warn-{post['id']}"]
+
+    monkeypatch.setattr(collector, "enrich_post", fake_enrich_post)
+
+    enriched, warnings = collector.enrich_posts(
+        [{"id": "1"}, {"id": "2"}],
+        segment_name="Segment",
+        segment_config={},
+    )
+
+    assert [post["id"] for post in enriched] == ["1", "2"]
+    assert all(post["enriched"] for post in enriched)
+    assert warnings == ["warn-1", "warn-2"]
+
+
+def test_extract_listing_posts_supports_known_shapes() -> None:
+    post = {"id": "abc"}
+
+    assert voc_reddit._extract_listing_posts({"data": [post]}) == [post]
+    assert voc_reddit._extract_listing_posts({"posts": [post]}) == [post]
+    assert voc_reddit._extract_listing_posts({"data": {"children": [{"data": post}]}}) == [post]
+    assert voc_reddit._extract_listing_posts([post]) == [post]
+    assert voc_reddit._extract_listing_posts({"unexpected": True}) == []
+
+
+class CachingStore(voc_reddit.RedditHistoryStore):
+    def __init__(self, cached: Any = None) -> None:
+        super().__init__(None)
+        self.cached = cached
+        self.saved: List[Any] = []
+
+    def get_analysis(self, segment_name: str, post_id: str, prompt_hash: str) -> Any:
+        return self.cached
+
+    def save_analysis(self, segment_name: str, post_id: str, prompt_hash: str, analysis: Any) -> None:
+        self.saved.append((post_id, prompt_hash, analysis))
+
+
+class AnalysisGemini:
+    default_model = "test-model"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def _load_prompt(self, _template_name: str) -> str:
+        return "Analyse {discussion_text}"
+
+    def generate_json_response(self, *_args: Any, **_kwargs: Any) -> Any:
+        self.calls += 1
+        data = {
+            "relevance_score": 0.9,
+            "reasoning": "r",
+            "identified_pain_point": "p",
+            "outstaffer_solution_angle": "a",
+        }
+        return type("Response", (), {"raw_text": "{}", "data": data})()
+
+
+def test_enrich_post_reuses_cached_analysis() -> None:
+    gemini = AnalysisGemini()
+    store = CachingStore(cached={"relevance_score": 0.5})
+    collector = voc_reddit.RedditDataCollector(api_key="key", gemini_client=gemini, history_store=store)
+
+    post, warnings = collector.enrich_post({"id": "p1", "title": "T"}, segment_name="S", segment_config={})
+
+    assert post["ai_analysis"] == {"relevance_score": 0.5}
+    assert gemini.calls == 0
+    assert not warnings
+
+
+def test_enrich_post_caches_fresh_analysis() -> None:
+    gemini = AnalysisGemini()
+    store = CachingStore()
+    collector = voc_reddit.RedditDataCollector(api_key="key", gemini_client=gemini, history_store=store)
+
+    post, _warnings = collector.enrich_post({"id": "p1", "title": "T"}, segment_name="S", segment_config={})
+
+    assert gemini.calls == 1
+    assert [(pid, analysis) for pid, _hash, analysis in store.saved] == [("p1", post["ai_analysis"])]
+
+
+def test_fetch_posts_reports_failed_subreddits_and_keeps_others(monkeypatch: Any) -> None:
+    collector = voc_reddit.RedditDataCollector(
+        api_key="key",
+        gemini_client=type("Gemini", (), {"default_model": "test-model"})(),
+        history_store=voc_reddit.RedditHistoryStore(None),
+    )
+
+    def fake_fetch(subreddit: str, *, filters: Any) -> List[Dict[str, Any]]:
+        if subreddit == "broken":
+            raise voc_reddit.requests.ConnectionError("boom")
+        time.sleep(0.05 if subreddit == "slow" else 0)
+        return [{"id": subreddit, "title": subreddit, "score": 1, "num_comments": 1}]
+
+    monkeypatch.setattr(collector, "_fetch_subreddit", fake_fetch)
+
+    curated, raw, warnings = collector.fetch_posts(
+        segment_name="Segment",
+        segment_config={"subreddits": ["slow", "broken", "fast"]},
+    )
+
+    assert [post["id"] for post in raw] == ["slow", "fast"]
+    assert len(curated) == 2
+    assert warnings == ["Failed to fetch subreddit 'broken': boom"]
+
+
+def test_enrich_posts_drops_posts_that_raise(monkeypatch: Any) -> None:
+    collector = voc_reddit.RedditDataCollector(
+        api_key="key",
+        gemini_client=type("Gemini", (), {"default_model": "test-model"})(),
+        history_store=voc_reddit.RedditHistoryStore(None),
+    )
+
+    def fake_enrich_post(post: Dict[str, Any], **_kwargs: Any) -> Any:
+        if post["id"] == "bad":
+            raise RuntimeError("boom")
+        return post, []
+
+    monkeypatch.setattr(collector, "enrich_post", fake_enrich_post)
+
+    enriched, warnings = collector.enrich_posts(
+        [{"id": "bad"}, {"id": "good"}],
+        segment_name="Segment",
+        segment_config={},
+    )
+
+    assert enriched == [{"id": "good"}]
+    assert warnings == ["Enrichment failed for post 'bad': boom"]
+
+
+def test_ttl_cache_expires_and_evicts(monkeypatch: Any) -> None:
+    now = [100.0]
+    monkeypatch.setattr(voc_reddit.time, "monotonic", lambda: now[0])
+    cache = voc_reddit._TTLCache(maxsize=2)
+
+    cache.set("a", 1, ttl=10)
+    cache.set("b", 2, ttl=10)
+    cache.get("a")
+    cache.set("c", 3, ttl=10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    now[0] = 111.0
+    assert cache.get("a") is None
+
+
+def test_fetch_posts_can_combine_subreddits(monkeypatch: Any) -> None:
+    collector = voc_reddit.RedditDataCollector(
+        api_key="key",
+        gemini_client=type("Gemini", (), {"default_model": "test-model"})(),
+        history_store=voc_reddit.RedditHistoryStore(None),
+    )
+    requested: List[str] = []
+
+    def fake_fetch(subreddit: str, *, filters: Any) -> List[Dict[str, Any]]:
+        requested.append(subreddit)
+        return [
+            {"id": "1", "subreddit": "one", "score": 5, "num_comments": 1},
+            {"id": "2", "subreddit": "two", "score": 9, "num_comments": 1},
+        ]
+
+    monkeypatch.setattr(collector, "_fetch_subreddit", fake_fetch)
+
+    curated, _raw, _warnings = collector.fetch_posts(
+        segment_name="Segment",
+        segment_config={
+            "subreddits": ["one", "two"],
+            "reddit_filters": {"combine_subreddits": True},
+        },
+    )
+
+    assert requested == ["one+two"]
+    assert [(post["id"], post["subreddit"]) for post in curated] == [("2", "two"), ("1", "one")]
+
+
+def test_load_segment_config_reloads_after_edit(monkeypatch: Any, tmp_path: pathlib.Path) -> None:
+    monkeypatch.setattr(voc_reddit, "_SEGMENT_CONFIG_DIR", tmp_path)
+    config_path = tmp_path / "segment_test_segment.json"
+    config_path.write_text('{"subreddits": ["one"]}', encoding="utf-8")
+
+    first = voc_reddit.load_segment_config("Test Segment")
+    first["subreddits"].append("mutated")
+    config_path.write_text('{"subreddits": ["two"]}', encoding="utf-8")
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert voc_reddit.load_segment_config("Test Segment") == {"subreddits": ["two"]}
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, content: bytes, headers: Dict[str, str]):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+def test_fetch_subreddit_revalidates_expired_listing_with_etag(monkeypatch: Any) -> None:
+    collector = voc_reddit.RedditDataCollector(
+        api_key="key",
+        gemini_client=type("Gemini", (), {"default_model": "test-model"})(),
+        history_store=voc_reddit.RedditHistoryStore(None),
+    )
+    sent_headers: List[Any] = []
+    responses = [
+        FakeResponse(200, b'{"posts": [{"id": "a"}]}', {"ETag": '"v1"'}),
+        FakeResponse(304, b"", {"ETag": '"v1"'}),
+    ]
+
+    def fake_get(url: str, *, params: Any, headers: Any, timeout: int) -> FakeResponse:
+        sent_headers.append(headers)
+        return responses.pop(0)
+
+    monkeypatch.setattr(collector._session, "get", fake_get)
+    filters = voc_reddit.RedditFilters()
+
+    first = collector._fetch_subreddit("etag_test", filters=filters)
+    voc_reddit._response_cache.clear()
+    second = collector._fetch_subreddit("etag_test", filters=filters)
+
+    assert first == second == [{"id": "a"}]
+    assert sent_headers == [None, {"If-None-Match": '"v1"'}]
+
+
+def test_history_store_builds_client_on_first_use() -> None:
+    calls: List[int] = []
+
+    def factory() -> FakeFirestore:
+        calls.append(1)
+        return FakeFirestore(existing=["old"])
+
+    store = voc_reddit.RedditHistoryStore(client_factory=factory)
+    assert calls == []
+
+    assert store.filter_unseen("Segment", ["old", "new"]) == {"new"}
+    store.filter_unseen("Segment", ["newer"])
+    assert calls == [1]
+
+
+def test_history_store_falls_back_to_memory_when_client_fails() -> None:
+    def factory() -> Any:
+        raise RuntimeError("no credentials")
+
+    store = voc_reddit.RedditHistoryStore(client_factory=factory)
+    store.mark("Segment", ["a"])
+
+    assert store.client is None
+    assert store.filter_unseen("Segment", ["a", "b"]) == {"b"}
@@ -14,10 +14,28 @@ if str(BACKEND_ROOT) not in sys.path:
     sys.path.insert(0, str(BACKEND_ROOT))
 
 from core.gemini_client import GeminiClientError
-from intelligence import voc_synthesis
+from intelligence import prescore_cache, voc_synthesis
 from intelligence.models import PreScoreResult
 
 
+@pytest.fixture(autouse=True)
+def _clear_prescore_cache() -> None:
+    prescore_cache.cache.clear()
+
+
+def test_clean_text_for_json_normalises_whitespace_and_keeps_quotes() -> None:
+    raw = '  Say &quot;hi&quot;\r\n\tto C:\\temp   now '
+
+    assert voc_synthesis.clean_text_for_json(raw) == 'Say "hi" to C:\\temp now'
+    assert voc_synthesis.clean_text_for_json(raw, max_length=6) == 'Say "h'
+
+
+def test_clean_text_for_json_fast_path_matches_full_cleanup() -> None:
+    assert voc_synthesis.clean_text_for_json(" Clean title ") == "Clean title"
+    assert voc_synthesis.clean_text_for_json("Clean title", max_length=6) == "Clean"
+    assert voc_synthesis.clean_text_for_json("two  spaces\xa0here") == "two spaces here"
+
+
 class DummyResponse:
     def __init__(self, data: Dict[str, Any]):
         self.data = data
@@ -29,9 +47,19 @@ class DummyGemini:
         self._payload = payload
         self.default_model = "test-model"
 
+        self.calls = 0
+
     def generate_json_response(self, *args: Any, **kwargs: Any) -> DummyResponse:
+        self.calls += 1
         return DummyResponse(self._payload)
 
+    def _load_prompt(self, _template_name: str) -> str:
+        return "{posts_json}"
+
+    def generate_text(self, **_kwargs: Any) -> str:
+        # No batch scores, so pre_score_posts falls back to single-post calls.
+        return ""
+
 
 def test_pre_score_post_success() -> None:
     post = {"id": "abc123", "title": "Hiring help", "content_snippet": "We need EOR"}
@@ -56,6 +84,50 @@ def test_pre_score_post_success() -> None:
     assert result.reason == "Direct hiring challenge"
 
 
+def test_pre_score_post_reuses_cached_result() -> None:
+    post = {"id": "abc123", "title": "Hiring help", "content_snippet": "We need EOR"}
+    gemini = DummyGemini({"post_id": "abc123", "score": 7, "priority": True})
+
+    first = voc_synthesis.pre_score_post(post, "Segment", gemini_client=gemini)
+    second = voc_synthesis.pre_score_post(post, "Segment", gemini_client=gemini)
+
+    assert second == first
+    assert gemini.calls == 1
+
+
+def test_pre_score_post_cache_key_includes_audience() -> None:
+    post = {"id": "abc123", "title": "Hiring help", "content_snippet": "We need EOR"}
+    gemini = DummyGemini({"post_id": "abc123", "score": 7, "priority": True})
+
+    voc_synthesis.pre_score_post(
+        post, "Segment", gemini_client=gemini, segment_config={"audience": "HR"}
+    )
+    voc_synthesis.pre_score_post(
+        post, "Segment", gemini_client=gemini, segment_config={"audience": "Finance"}
+    )
+
+    assert gemini.calls == 2
+
+
+def test_prescore_cache_treats_sqlite_errors_as_misses(tmp_path: pathlib.Path) -> None:
+    cache = prescore_cache.PreScoreCache(str(tmp_path / "prescore.sqlite"), maxsize=0)
+    cache._db.close()
+    result = PreScoreResult(post_id="1", score=5, priority=False, reason="meh")
+
+    cache.set("key", result)
+
+    assert cache.get("key") is None
+
+
+def test_prescore_cache_persists_to_sqlite(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / "prescore.sqlite")
+    result = PreScoreResult(post_id="1", score=5, priority=False, reason="meh")
+    prescore_cache.PreScoreCache(path).set("key", result)
+
+    assert prescore_cache.PreScoreCache(path).get("key") == result
+    assert prescore_cache.PreScoreCache(path).get("missing") is None
+
+
 def test_pre_score_post_invalid_payload_raises() -> None:
     post = {"id": "abc123", "title": "Hiring help", "content_snippet": "We need EOR"}
     gemini = DummyGemini({"post_id": "abc123", "priority": True})
@@ -68,8 +140,16 @@ def test_pre_score_post_invalid_payload_raises() -> None:
         )
 
 
+def test_pre_score_post_non_object_payload_raises() -> None:
+    post = {"id": "abc123", "title": "Hiring help", "content_snippet": "We need EOR"}
+    gemini = DummyGemini([{"post_id": "abc123", "score": 7, "priority": True}])  # type: ignore[arg-type]
+
+    with pytest.raises(GeminiClientError):
+        voc_synthesis.pre_score_post(post, "Segment", gemini_client=gemini)
+
+
 def test_pre_score_posts_collects_warnings(monkeypatch: pytest.MonkeyPatch) -> None:
-    posts = [{"id": "1"}, {"id": "2"}]
+    posts = [{"id": "1", "title": "a"}, {"id": "2", "title": "b"}]
 
     def fake_pre_score_post(post: Dict[str, Any], *_args: Any, **_kwargs: Any) -> PreScoreResult:
         if post["id"] == "1":
@@ -90,7 +170,7 @@ def test_pre_score_posts_collects_warnings(monkeypatch: pytest.MonkeyPatch) -> N
 
 
 def test_pre_score_posts_preserves_input_order(monkeypatch: pytest.MonkeyPatch) -> None:
-    posts = [{"id": "1"}, {"id": "2"}]
+    posts = [{"id": "1", "title": "a"}, {"id": "2", "title": "b"}]
 
     def fake_pre_score_post(post: Dict[str, Any], *_args: Any, **_kwargs: Any) -> PreScoreResult:
         if post["id"] == "1":
@@ -107,3 +187,217 @@ def test_pre_score_posts_preserves_input_order(monkeypatch: pytest.MonkeyPatch)
 
     assert not warnings
     assert [post["id"] for post in scored] == ["1", "2"]
+
+
+class BatchTextGemini:
+    default_model = "test-model"
+
+    def _load_prompt(self, _template_name: str) -> str:
+        return "{posts_json}"
+
+    def generate_text(self, *, prompt: str, **_kwargs: Any) -> str:
+        lines = prompt.splitlines()
+        # Finish the first batch last to exercise reordering.
+        if '"p0"' in lines[0]:
+            time.sleep(0.05)
+        return "\n".join(
+            f'{{"post_index": {index}, "score": {index}, "reason": "r"}}'
+            for index in range(len(lines))
+        )
+
+
+def test_batch_prescore_posts_runs_batches_concurrently_in_order() -> None:
+    posts = [{"id": str(index), "title": f"p{index}"} for index in range(5)]
+
+    scored, warnings = voc_synthesis.batch_prescore_posts(
+        posts, {}, "Segment", BatchTextGemini(), batch_size=2
+    )
+
+    assert warnings == []
+    assert [post["id"] for post in scored] == ["0", "1", "2", "3", "4"]
+
+
+def test_batch_prescore_posts_only_sends_uncached_posts() -> None:
+    prompts: list = []
+
+    class RecordingGemini(BatchTextGemini):
+        def generate_text(self, *, prompt: str, **kwargs: Any) -> str:
+            prompts.append(prompt)
+            return super().generate_text(prompt=prompt, **kwargs)
+
+    client = RecordingGemini()
+    voc_synthesis.batch_prescore_posts([{"id": "0", "title": "p0"}], {}, "Segment", client)
+    posts = [{"id": "0", "title": "p0"}, {"id": "1", "title": "p1"}]
+
+    scored, warnings = voc_synthesis.batch_prescore_posts(posts, {}, "Segment", client)
+
+    assert warnings == []
+    assert [post["id"] for post in scored] == ["0", "1"]
+    assert len(prompts) == 2
+    assert '"p0"' not in prompts[1] and '"p1"' in prompts[1]
+
+    voc_synthesis.batch_prescore_posts(posts, {}, "Segment", client)
+    assert len(prompts) == 2
+
+
+def test_batch_prescore_posts_requests_deterministic_scores() -> None:
+    temperatures: list = []
+
+    class RecordingGemini(BatchTextGemini):
+        def generate_text(self, *, prompt: str, **kwargs: Any) -> str:
+            temperatures.append(kwargs["temperature"])
+            return super().generate_text(prompt=prompt, **kwargs)
+
+    voc_synthesis.batch_prescore_posts([{"id": "0", "title": "p0"}], {}, "Segment", RecordingGemini())
+
+    assert temperatures == [0.0]
+
+
+def test_batch_prescore_posts_scores_empty_posts_without_gemini() -> None:
+    class NoCallGemini(BatchTextGemini):
+        def generate_text(self, **_kwargs: Any) -> str:
+            raise AssertionError("empty posts should not reach Gemini")
+
+    scored, warnings = voc_synthesis.batch_prescore_posts(
+        [{"id": "1", "title": ""}, {"id": "2"}], {}, "Segment", NoCallGemini()
+    )
+
+    assert warnings == []
+    assert [post["prescore"]["relevance_score"] for post in scored] == [0, 0]
+
+
+def test_batch_prescores_do_not_answer_single_post_lookups() -> None:
+    post = {"id": "0", "title": "p0"}
+    voc_synthesis.batch_prescore_posts([post], {}, "Segment", BatchTextGemini())
+    gemini = DummyGemini({"post_id": "0", "score": 4, "priority": False})
+
+    result = voc_synthesis.pre_score_post(post, "Segment", gemini_client=gemini)
+
+    assert gemini.calls == 1
+    assert result.score == 4
+
+
+def test_pre_score_posts_batches_first_and_falls_back_per_post(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    posts = [{"id": "0", "title": "p0"}, {"id": "1", "title": "p1"}, {"id": "2", "title": "p2"}]
+    single_calls: list = []
+
+    class PartialBatchGemini(BatchTextGemini):
+        def generate_text(self, *, prompt: str, **_kwargs: Any) -> str:
+            # Skip the line for the middle post.
+            return '{"post_index": 0, "score": 8, "reason": "r"}\n{"post_index": 2, "score": 2, "reason": "r"}'
+
+    def fake_pre_score_post(post: Dict[str, Any], *_args: Any, **_kwargs: Any) -> PreScoreResult:
+        single_calls.append(post["id"])
+        return PreScoreResult(post_id=post["id"], score=5, priority=False, reason="single")
+
+    monkeypatch.setattr(voc_synthesis, "pre_score_post", fake_pre_score_post)
+
+    scored, warnings = voc_synthesis.pre_score_posts(
+        posts, "Segment", gemini_client=PartialBatchGemini()
+    )
+
+    assert warnings == []
+    assert single_calls == ["1"]
+    assert [post["prescore"]["relevance_score"] for post in scored] == [8, 5, 2]
+    assert [post["prescore"]["priority"] for post in scored] == [True, False, False]
+
+
+def _pre_score_with_batch_reply(
+    monkeypatch: pytest.MonkeyPatch, reply: Any
+) -> Any:
+    posts = [{"id": "0", "title": "p0"}, {"id": "1", "title": "p1"}]
+    single_calls: list = []
+
+    class ReplyGemini(BatchTextGemini):
+        def generate_text(self, **_kwargs: Any) -> str:
+            if isinstance(reply, Exception):
+                raise reply
+            return reply
+
+    def fake_pre_score_post(post: Dict[str, Any], *_args: Any, **_kwargs: Any) -> PreScoreResult:
+        single_calls.append(post["id"])
+        return PreScoreResult(post_id=post["id"], score=5, priority=False, reason="single")
+
+    monkeypatch.setattr(voc_synthesis, "pre_score_post", fake_pre_score_post)
+    scored, warnings = voc_synthesis.pre_score_posts(posts, "Segment", gemini_client=ReplyGemini())
+    return scored, warnings, single_calls
+
+
+def test_pre_score_posts_skips_non_object_batch_lines(monkeypatch: pytest.MonkeyPatch) -> None:
+    scored, warnings, single_calls = _pre_score_with_batch_reply(
+        monkeypatch,
+        '[{"post_index": 0, "score": 8, "reason": "r"}]\n{"post_index": 1, "score": 2, "reason": "r"}',
+    )
+
+    assert warnings == []
+    assert single_calls == ["0"]
+    assert [post["prescore"]["relevance_score"] for post in scored] == [5, 2]
+
+
+def test_pre_score_posts_coerces_non_string_batch_reasons(monkeypatch: pytest.MonkeyPatch) -> None:
+    scored, _warnings, single_calls = _pre_score_with_batch_reply(
+        monkeypatch,
+        '{"post_index": 0, "score": 8, "reason": 7}\n{"post_index": 1, "score": 2, "reason": null}',
+    )
+
+    assert single_calls == []
+    assert [post["prescore"]["quick_reason"] for post in scored] == ["7", ""]
+
+
+def test_pre_score_posts_falls_back_when_a_batch_raises(monkeypatch: pytest.MonkeyPatch) -> None:
+    scored, warnings, single_calls = _pre_score_with_batch_reply(monkeypatch, RuntimeError("boom"))
+
+    assert warnings == []
+    assert sorted(single_calls) == ["0", "1"]
+    assert [post["id"] for post in scored] == ["0", "1"]
+
+
+class CapturingGemini:
+    def __init__(self) -> None:
+        self.context: Dict[str, Any] = {}
+
+    def generate_json_response(self, _template: str, context: Dict[str, Any], **_kwargs: Any) -> DummyResponse:
+        self.context = context
+        return DummyResponse({"queries": ["q1", " "]})
+
+
+def test_generate_curated_queries_formats_pain_points_and_trends() -> None:
+    posts = [
+        {"title": "T1", "subreddit": "hr", "ai_analysis": {"identified_pain_point": "Payroll", "relevance_score": 8}},
+        {"title": "T2", "subreddit": "jobs", "ai_analysis": {}},
+        {"title": "T3", "ai_analysis": "not a dict"},
+    ]
+    trends = [
+        {"query": "eor", "related_queries": {"rising": [{"query": "eor cost"}, {"value": 1}]}},
+        {"query": "peo", "related_queries": {}},
+        {"related_queries": {}},
+    ]
+    gemini = CapturingGemini()
+
+    queries, warnings = voc_synthesis.generate_curated_queries(
+        posts, trends, {"audience": "HR"}, segment_name="Segment", gemini_client=gemini
+    )
+
+    assert (queries, warnings) == (["q1"], [])
+    assert gemini.context["pain_points"] == (
+        "- Payroll (relevance 8) — r/hr | T1\n- (pain point unavailable) — r/jobs | T2"
+    )
+    assert gemini.context["trends_summary"] == (
+        "- eor: rising searches include eor cost\n- peo: steady interest over time"
+    )
+
+
+def test_filter_high_value_posts_rejects_missing_and_non_numeric_scores() -> None:
+    posts = [
+        {"id": "a", "ai_analysis": {"relevance_score": 7}},
+        {"id": "b", "ai_analysis": {"relevance_score": "9"}},
+        {"id": "c", "ai_analysis": None},
+        {"id": "d", "ai_analysis": {"relevance_score": 5.5}},
+    ]
+
+    accepted, rejected = voc_synthesis.filter_high_value_posts(posts, min_score=6.0)
+
+    assert [post["id"] for post in accepted] == ["a"]
+    assert [post["id"] for post in rejected] == ["b", "c", "d"]
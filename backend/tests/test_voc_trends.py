@@ -0,0 +1,224 @@
+import pathlib
+import sys
+import threading
+import types
+from typing import Any, List
+
+import pandas as pd
+import pytest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+BACKEND_ROOT = PROJECT_ROOT / "backend"
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from intelligence import voc_trends
+
+
+@pytest.fixture(autouse=True)
+def _fresh_trends_cache(monkeypatch: Any) -> None:
+    monkeypatch.setattr(voc_trends, "_trends_cache", voc_trends._TrendsCache())
+
+
+def _interest_frame() -> pd.DataFrame:
+    index = pd.DatetimeIndex(["2024-01-07", "2024-01-14"], name="date")
+    return pd.DataFrame(
+        {"hiring": [40, 55], "recruitment software": [10, 12], "isPartial": [False, True]},
+        index=index,
+    )
+
+
+def test_dataframe_to_records_serialises_dates_and_renames() -> None:
+    records = voc_trends._dataframe_to_records(
+        _interest_frame(),
+        rename_columns={"hiring": "primary_interest"},
+    )
+
+    assert records == [
+        {"date": "2024-01-07T00:00:00", "primary_interest": 40, "recruitment software": 10, "isPartial": False},
+        {"date": "2024-01-14T00:00:00", "primary_interest": 55, "recruitment software": 12, "isPartial": True},
+    ]
+
+
+def test_dataframe_to_records_fills_missing_values() -> None:
+    frame = pd.DataFrame({"query": ["a", None], "value": [100, 50]})
+
+    records = voc_trends._dataframe_to_records(frame)
+
+    assert records == [
+        {"index": 0, "query": "a", "value": 100},
+        {"index": 1, "query": False, "value": 50},
+    ]
+
+
+def test_dataframe_to_records_handles_empty_frames() -> None:
+    assert voc_trends._dataframe_to_records(None) == []
+    assert voc_trends._dataframe_to_records(pd.DataFrame()) == []
+
+
+def test_dataframe_to_records_fills_missing_dates() -> None:
+    frame = pd.DataFrame({"when": pd.to_datetime(["2024-02-01 12:30:00", None])})
+
+    records = voc_trends._dataframe_to_records(frame)
+
+    assert records == [
+        {"index": 0, "when": "2024-02-01T12:30:00"},
+        {"index": 1, "when": False},
+    ]
+
+
+class FakeTrendReq:
+    def __init__(self) -> None:
+        self.payloads: List[List[str]] = []
+
+    def build_payload(self, terms: List[str], **_kwargs: Any) -> None:
+        self.payloads.append(list(terms))
+
+    def interest_over_time(self) -> pd.DataFrame:
+        index = pd.DatetimeIndex(["2024-01-07"], name="date")
+        return pd.DataFrame({term: [len(term)] for term in self.payloads[-1]}, index=index)
+
+    def related_queries(self) -> dict:
+        return {term: {"top": None, "rising": None} for term in self.payloads[-1]}
+
+    def related_topics(self) -> dict:
+        return {term: {"top": None, "rising": None} for term in self.payloads[-1]}
+
+
+def test_fetch_google_trends_batches_keywords(monkeypatch: Any) -> None:
+    # Payloads are fetched on worker threads, each with its own session.
+    fakes: List[FakeTrendReq] = []
+
+    def make_fake() -> FakeTrendReq:
+        fake = FakeTrendReq()
+        fakes.append(fake)
+        return fake
+
+    monkeypatch.setattr(voc_trends, "_get_pytrends", make_fake)
+    keywords = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+    trends, warnings = voc_trends.fetch_google_trends(
+        {"google_trends": {"primary_keywords": keywords, "comparison_keyword": "hiring"}}
+    )
+
+    assert sorted(payload for fake in fakes for payload in fake.payloads) == [
+        ["a", "bb", "ccc", "dddd", "hiring"],
+        ["eeeee", "hiring"],
+    ]
+    assert [trend["query"] for trend in trends] == keywords
+    # Each keyword is rescaled against the comparison keyword alone, so the
+    # other terms batched into its payload do not change its values.
+    assert trends[1]["interest_over_time"] == [
+        {"date": "2024-01-07T00:00:00", "primary_interest": 33, "hiring": 100}
+    ]
+    assert trends[4]["interest_over_time"] == [
+        {"date": "2024-01-07T00:00:00", "primary_interest": 83, "hiring": 100}
+    ]
+    assert not warnings
+
+
+def test_fetch_google_trends_reuses_cached_payloads(monkeypatch: Any, tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / "trends.sqlite")
+    monkeypatch.setattr(voc_trends, "_trends_cache", voc_trends._TrendsCache(path))
+    fakes: List[FakeTrendReq] = []
+
+    def make_fake() -> FakeTrendReq:
+        fakes.append(FakeTrendReq())
+        return fakes[-1]
+
+    monkeypatch.setattr(voc_trends, "_get_pytrends", make_fake)
+    config = {"google_trends": {"primary_keywords": ["a", "bb"], "comparison_keyword": "hiring"}}
+
+    first, _ = voc_trends.fetch_google_trends(config)
+    # A new process would start with an empty memory cache but the same file.
+    monkeypatch.setattr(voc_trends, "_trends_cache", voc_trends._TrendsCache(path))
+    second, warnings = voc_trends.fetch_google_trends(config)
+
+    assert second == first
+    assert not warnings
+    assert len(fakes) == 1
+
+
+def test_fetch_google_trends_does_not_cache_empty_payloads(monkeypatch: Any) -> None:
+    class EmptyTrendReq(FakeTrendReq):
+        def interest_over_time(self) -> pd.DataFrame:
+            return pd.DataFrame()
+
+    fakes: List[FakeTrendReq] = []
+
+    def make_fake() -> FakeTrendReq:
+        fakes.append(EmptyTrendReq())
+        return fakes[-1]
+
+    monkeypatch.setattr(voc_trends, "_get_pytrends", make_fake)
+    config = {"google_trends": {"primary_keywords": ["a"]}}
+
+    _, warnings = voc_trends.fetch_google_trends(config)
+    voc_trends.fetch_google_trends(config)
+
+    assert warnings and "possible rate limit" in warnings[0]
+    assert len(fakes) == 2
+
+
+def test_trends_cache_evicts_least_recently_used() -> None:
+    cache = voc_trends._TrendsCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+
+def test_fetch_google_trends_reuses_sessions_across_calls(monkeypatch: Any) -> None:
+    created: List[FakeTrendReq] = []
+
+    class CountingTrendReq(FakeTrendReq):
+        def __init__(self, **_kwargs: Any) -> None:
+            super().__init__()
+            created.append(self)
+
+    monkeypatch.setitem(sys.modules, "pytrends.request", types.SimpleNamespace(TrendReq=CountingTrendReq))
+    monkeypatch.setattr(voc_trends, "_pytrends_tls", threading.local())
+
+    keywords = ["a", "bb", "ccc", "dddd", "eeeee", "ffffff"]
+    for keyword in keywords:
+        voc_trends.fetch_google_trends({"google_trends": {"primary_keywords": [keyword]}})
+
+    # One session per worker thread, however many calls there are.
+    assert len(created) <= voc_trends._MAX_TRENDS_WORKERS
+    assert sum(len(fake.payloads) for fake in created) == len(keywords)
+
+
+def test_trends_cache_treats_sqlite_errors_as_memory_only(tmp_path: pathlib.Path) -> None:
+    cache = voc_trends._TrendsCache(str(tmp_path / "trends.sqlite"))
+    cache._db.close()
+
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("missing") is None
+
+
+def test_fetch_google_trends_retry_does_not_duplicate_records(monkeypatch: Any) -> None:
+    monkeypatch.setattr(voc_trends, "_get_pytrends", FakeTrendReq)
+    monkeypatch.setattr(voc_trends.time, "sleep", lambda _seconds: None)
+    build_keyword_trend = voc_trends._build_keyword_trend
+    calls: List[str] = []
+
+    def flaky_build(keyword: str, *args: Any, **kwargs: Any) -> Any:
+        calls.append(keyword)
+        if calls == ["a", "bb"]:
+            raise RuntimeError("partway failure")
+        return build_keyword_trend(keyword, *args, **kwargs)
+
+    monkeypatch.setattr(voc_trends, "_build_keyword_trend", flaky_build)
+
+    trends, warnings = voc_trends.fetch_google_trends({"google_trends": {"primary_keywords": ["a", "bb"]}})
+
+    assert [trend["query"] for trend in trends] == ["a", "bb"]
+    assert not warnings